@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import contextlib
+from typing import Any
 
+import numpy as np
 import pandas as pd
 from aiida.orm import Group, load_group
 from aiida_aurora.schemas.battery import BatterySample, BatterySampleJsonTypes
@@ -10,10 +12,26 @@ from traitlets import HasTraits, Integer
 
 from ..groups import SAMPLES_GROUP_PREFIX as GROUP_PREFIX
 from .backends.backend import Backend
-from .utils import get_valid, style, to_pd_query
+from .utils import get_mask, get_valid, style
 
 Types: dict = BatterySampleJsonTypes
 
+# query conditions ignored if empty
+BOUNDS = ("group", "from", "to")
+
+# low-cardinality fields, cached as categoricals
+CATEGORICAL_FIELDS = (
+    "metadata.batch",
+    "metadata.subbatch",
+    "metadata.creation_process",
+    "specs.case",
+    "specs.manufacturer",
+    "specs.composition.anode.formula",
+    "specs.composition.cathode.formula",
+    "specs.composition.electrolyte.formula",
+    "specs.composition.separator.name",
+)
+
 # TODO some operations are done on raw while others on samples - consolidate?
 
 
@@ -35,6 +53,8 @@ class SamplesModel(HasTraits):
         The list of validated sample models.
     `samples` : `pd.DataFrame`
         The local cache of available samples.
+    `view` : `pd.DataFrame`
+        A read-only handle on the local cache of available samples.
     """
 
     OPTIONS = {
@@ -60,6 +80,13 @@ class SamplesModel(HasTraits):
         self.__backend = backend
         self.__raw: dict[int, dict] = {}
         self.__cache = pd.DataFrame()
+        self.__groups: dict[str, set[int]] = {}
+
+        # query condition masks and field codes, valid until the next update
+        self.__masks: dict[tuple, np.ndarray] = {}
+        self.__codes: dict[str, tuple[np.ndarray, list]] = {}
+
+        self.observe(self.__clear_masks, "updated")
 
         if self.__backend:
             self.__backend.init()
@@ -125,9 +152,7 @@ class SamplesModel(HasTraits):
         `pd.DataFrame`
             The samples dataframe cache.
         """
-        if self.__raw and not self.has_samples():
-            self.cache()
-        return self.__cache.copy(deep=True)
+        return self.view.copy(deep=True)
 
     @samples.setter
     def samples(self, samples: pd.DataFrame) -> None:
@@ -139,6 +164,25 @@ class SamplesModel(HasTraits):
             A samples dataframe.
         """
         self.__cache = samples
+        self.__groups = get_group_index(samples)
+        self.__clear_masks()
+
+    @property
+    def view(self) -> pd.DataFrame:
+        """Return samples as a flat dataframe, without copying.
+
+        Serves read-only access to the local cache of samples, e.g.
+        for querying. The returned dataframe must not be modified.
+        Use `samples` for a modifiable copy.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The samples dataframe cache.
+        """
+        if self.__raw and not self.has_samples():
+            self.cache()
+        return self.__cache
 
     @property
     def highest_sample_id(self) -> int:
@@ -177,8 +221,7 @@ class SamplesModel(HasTraits):
             True if batch is present.
         """
         if self.has_samples():
-            batches = self.__cache["metadata.batch"].drop_duplicates().values
-            return batch in batches
+            return bool((self.__cache["metadata.batch"] == batch).any())
         return False
 
     def has_samples(self) -> bool:
@@ -207,22 +250,19 @@ class SamplesModel(HasTraits):
         return self.query({"id": sample_id})
 
     def get_group_labels(self, discard="") -> list[str]:
-        """Fetch group labels from cache.
+        """Fetch group labels from the group index.
 
         Returns
         -------
         `list[str]`
             A list of available group labels.
         """
-        if self.has_samples():
-            column = "metadata.groups"
-            labels = list(self.__cache[column].explode().unique())
-            # TODO simplify the following command
+        labels = [label for label, ids in self.__groups.items() if ids]
+        if "all-samples" in labels:
             labels.insert(0, labels.pop(labels.index("all-samples")))
-            if discard:
-                labels.remove(discard)
-            return labels
-        return []
+        if discard:
+            labels.remove(discard)
+        return labels
 
     def get_group_samples(self, group: str) -> set[int]:
         """Return the samples set assigned to the given group.
@@ -237,9 +277,7 @@ class SamplesModel(HasTraits):
         `set[int]`
             The set of samples assigned to the given group.
         """
-        column = "metadata.groups"
-        condition = self.__cache[column].apply(lambda groups: group in groups)
-        return set(self.__cache[condition].index)
+        return set(self.__groups.get(group, ()))
 
     def save_group(self, ids: list[int], group: str) -> None:
         """Save group by attaching its label to selected samples.
@@ -272,6 +310,9 @@ class SamplesModel(HasTraits):
         rows, column = ids or slice(None), "metadata.groups"
         self.__cache.loc[rows, column] = self.__cache.loc[rows, column].apply(
             lambda groups: groups | {group})
+        members = self.__groups.setdefault(group, set())
+        members.update(ids or self.__cache.index)
+        self.__masks.clear()
 
     def remove_from_group(self, ids: list[int], group: str) -> None:
         """Remove selected samples from group.
@@ -283,9 +324,14 @@ class SamplesModel(HasTraits):
         `group` : `str`
             The group label.
         """
-        rows, column = ids or slice(None), "metadata.groups"
-        self.__cache.loc[rows, column] = self.__cache.loc[rows, column].apply(
-            lambda groups: groups - {group})
+        members = self.__groups.get(group, set())
+        rows = list(members.intersection(ids) if ids else members)
+        if rows:
+            column = "metadata.groups"
+            self.__cache.loc[rows, column] = self.__cache.loc[
+                rows, column].apply(lambda groups: groups - {group})
+            members.difference_update(rows)
+            self.__masks.clear()
 
     def get_aiida_groups(self) -> list[Group]:
         """docstring"""
@@ -326,7 +372,9 @@ class SamplesModel(HasTraits):
         `subbatch` : `str`
             The sub-batch label.
         """
-        self.__cache.loc[ids, "metadata.subbatch"] = subbatch
+        field = "metadata.subbatch"
+        self.__cache[field] = add_categories(self.__cache[field], [subbatch])
+        self.__cache.loc[ids, field] = subbatch
         self.updated += 1
 
     def load(self) -> None:
@@ -350,15 +398,50 @@ class SamplesModel(HasTraits):
         serialization.
 
         Caching also increments the `new_data_trigger` observable.
+
+        Rebuilds the full cache. Single sample operations update the
+        cached rows in place instead.
         """
+        self.__cache = normalize(self.raw)
+        self.__groups = get_group_index(self.__cache)
+        self.updated += 1
 
-        df = pd.json_normalize(self.raw)
+    def cache_samples(self, sample_ids: list[int]) -> None:
+        """Upsert or drop the cached rows of the given samples.
 
-        if not df.empty:
-            df = df.astype({c: t for c, t in Types.items() if c in df})
-            df.set_index("id", drop=True, inplace=True)
-            key = "metadata.creation_datetime"
-            df[key] = pd.to_datetime(df[key])
+        Samples present in the raw samples are (re)normalized and
+        upserted, preserving the order of existing rows. Samples no
+        longer present are dropped.
+
+        Parameters
+        ----------
+        `sample_ids` : `list[int]`
+            The ids of the added, updated, or deleted samples.
+        """
+
+        deleted = [sid for sid in sample_ids if sid not in self.__raw]
+        upserted = [sid for sid in sample_ids if sid in self.__raw]
+
+        self.__unindex_groups(sample_ids)
+
+        df = self.__cache.drop(index=deleted, errors="ignore")
+
+        rows = normalize([self.__raw[sid] for sid in upserted])
+
+        for label, ids in get_group_index(rows).items():
+            self.__groups.setdefault(label, set()).update(ids)
+
+        if df.empty:
+            df = rows
+        elif not rows.empty:
+            for field in df.columns.intersection(CATEGORICAL_FIELDS):
+                df[field] = add_categories(df[field], rows[field])
+                rows[field] = rows[field].cat.set_categories(
+                    df[field].cat.categories)
+            existing = rows.index.isin(df.index)
+            columns = df.columns.intersection(rows.columns)
+            df.loc[rows.index[existing], columns] = rows.loc[existing, columns]
+            df = pd.concat([df, rows[~existing]])
 
         self.__cache = df
         self.updated += 1
@@ -379,7 +462,7 @@ class SamplesModel(HasTraits):
         """
         self.__raw[sample.id] = sample.dict()
         if cache:
-            self.cache()
+            self.cache_samples([sample.id])
         if save:
             self.save()
 
@@ -423,7 +506,7 @@ class SamplesModel(HasTraits):
         for sample in samples:
             self.add(sample, cache=False, save=False)
         if cache:
-            self.cache()
+            self.cache_samples([sample.id for sample in samples])
         if save:
             self.save()
 
@@ -445,7 +528,7 @@ class SamplesModel(HasTraits):
             raise KeyError(f"sample {sample_id} does not exist.")
         del self.__raw[sample_id]
         if cache:
-            self.cache()
+            self.cache_samples([sample_id])
         if save:
             self.save()
 
@@ -471,7 +554,7 @@ class SamplesModel(HasTraits):
         for sid in sample_ids:
             self.delete(sid, cache=False, save=False)
         if cache:
-            self.cache()
+            self.cache_samples(list(sample_ids))
         if save:
             self.save()
 
@@ -535,19 +618,90 @@ class SamplesModel(HasTraits):
         if not self.has_samples():
             return self.__cache
 
-        df = self.samples
-        if group := query.pop("group", None):
-            field = "metadata.groups"
-            df = df[df[field].apply(lambda groups: group in groups)]
-
-        pd_query = to_pd_query(query) or "id"
-        results = df.query(pd_query)
+        mask = self.get_mask(query)
+        results = self.view if mask is None else self.view[mask]
 
         if not project or results.empty:
             return results
 
         return self._project_results(results, project)
 
+    def get_mask(self, query: dict) -> np.ndarray | None:
+        """Return the combined boolean mask of the query conditions.
+
+        Condition masks are cached until the next samples update, such
+        that repeated filter states skip re-evaluation. Conditions on
+        `id` are ad hoc selections, cheap to evaluate on the index, and
+        are not cached.
+
+        Parameters
+        ----------
+        `query` : `dict`
+            A dictionary of query conditions.
+
+        Returns
+        -------
+        `Optional[np.ndarray]`
+            The mask of the rows satisfying all conditions, or `None`
+            if there are no conditions.
+        """
+
+        mask = None
+
+        for field, value in query.items():
+
+            if value is None or field in BOUNDS and not value:
+                continue
+
+            if field == "id":
+                condition = self.__compile_mask(field, value)
+            else:
+                condition = self.__get_cached_mask(field, value)
+
+            mask = condition if mask is None else mask & condition
+
+        return mask
+
+    def get_facets(
+        self,
+        query: dict,
+        fields: list[str],
+    ) -> dict[str, list[tuple[Any, int]]]:
+        """Return the value counts of each field under the query.
+
+        The values of each field are counted over the samples matching
+        all conditions but those on the field itself, such that other
+        values of a filtered field remain selectable. All values of the
+        field are listed, including those without matching samples.
+
+        Parameters
+        ----------
+        `query` : `dict`
+            A dictionary of query conditions.
+        `fields` : `list[str]`
+            The fields to count.
+
+        Returns
+        -------
+        `dict[str, list[tuple[Any, int]]]`
+            The `(value, count)` pairs of each field.
+        """
+
+        if not self.has_samples():
+            return {}
+
+        facets = {}
+
+        for field in fields:
+            codes, values = self.__get_codes(field)
+            others = {k: v for k, v in query.items() if k != field}
+            if (mask := self.get_mask(others)) is not None:
+                codes = codes[mask]
+            counts = np.bincount(codes[codes >= 0], minlength=len(values))
+            facets[field] = list(zip(values, counts.tolist()))
+
+        return facets
+
     def display(self, df: pd.DataFrame) -> None:
         """Display a styled samples dataframe.
 
@@ -631,10 +785,184 @@ class SamplesModel(HasTraits):
 
         return results[project]
 
+    def __get_cached_mask(self, field: str, value) -> np.ndarray:
+        """Return the boolean mask of a query condition, cached.
+
+        Parameters
+        ----------
+        `field` : `str`
+            The queried field.
+        `value` : `Any`
+            The queried value(s).
+
+        Returns
+        -------
+        `np.ndarray`
+            The mask of the rows satisfying the condition.
+        """
+
+        if isinstance(value, (list, tuple, set)):
+            key = (field, frozenset(value))
+        else:
+            key = (field, value)
+
+        if key not in self.__masks:
+            self.__masks[key] = self.__compile_mask(field, value)
+
+        return self.__masks[key]
+
+    def __compile_mask(self, field: str, value) -> np.ndarray:
+        """Return the boolean mask of a query condition.
+
+        Group conditions are resolved through the group index.
+
+        Parameters
+        ----------
+        `field` : `str`
+            The queried field.
+        `value` : `Any`
+            The queried value(s).
+
+        Returns
+        -------
+        `np.ndarray`
+            The mask of the rows satisfying the condition.
+        """
+        if field == "group":
+            return self.view.index.isin(self.__groups.get(value, ()))
+        return get_mask(self.view, field, value)
+
+    def __get_codes(self, field: str) -> tuple[np.ndarray, list]:
+        """Return the value codes and unique values of the field.
+
+        Parameters
+        ----------
+        `field` : `str`
+            The field.
+
+        Returns
+        -------
+        `tuple[np.ndarray, list]`
+            The per-sample value codes, `-1` if missing, and the unique
+            values in order of appearance.
+        """
+        if field not in self.__codes:
+            codes, values = pd.factorize(self.view[field])
+            self.__codes[field] = (codes, values.tolist())
+        return self.__codes[field]
+
+    def __clear_masks(self, _=None) -> None:
+        """docstring"""
+        self.__masks.clear()
+        self.__codes.clear()
+
+    def __unindex_groups(self, sample_ids: list[int]) -> None:
+        """Discard the given cached samples from the group index.
+
+        Parameters
+        ----------
+        `sample_ids` : `list[int]`
+            The sample ids.
+        """
+        if not self.has_samples():
+            return
+        cached = self.__cache.index.intersection(sample_ids)
+        for sid, groups in self.__cache.loc[cached, "metadata.groups"].items():
+            for group in groups:
+                self.__groups[group].discard(sid)
+
     def __contains__(self, id: int) -> bool:
         return id in self.__raw
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, SamplesModel):
             return NotImplemented
-        return self.samples.equals(other.samples)
+        return as_objects(self.view).equals(as_objects(other.view))
+
+
+def normalize(samples: list[dict]) -> pd.DataFrame:
+    """Return raw samples as a flat typed dataframe indexed by id.
+
+    Parameters
+    ----------
+    `samples` : `list[dict]`
+        The raw samples.
+
+    Returns
+    -------
+    `pd.DataFrame`
+        The normalized samples dataframe.
+    """
+
+    df = pd.json_normalize(samples)
+
+    if not df.empty:
+        df = df.astype({c: t for c, t in Types.items() if c in df})
+        df.set_index("id", drop=True, inplace=True)
+        key = "metadata.creation_datetime"
+        df[key] = pd.to_datetime(df[key])
+        df = df.astype({c: "category" for c in CATEGORICAL_FIELDS if c in df})
+
+    return df
+
+
+def add_categories(column: pd.Series, values) -> pd.Series:
+    """Return the categorical column with any new values as categories.
+
+    Existing categories and their codes are preserved.
+
+    Parameters
+    ----------
+    `column` : `pd.Series`
+        A categorical column.
+    `values` : `Iterable`
+        The values to be stored in the column.
+
+    Returns
+    -------
+    `pd.Series`
+        The column, with extended categories if needed.
+    """
+    categories = column.cat.categories
+    new = pd.Index(pd.unique(pd.Series(values, dtype=object).dropna()))
+    new = new.difference(categories, sort=False)
+    return column.cat.add_categories(new) if len(new) else column
+
+
+def as_objects(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the samples dataframe without categorical columns.
+
+    Used to compare dataframes regardless of unused categories.
+
+    Parameters
+    ----------
+    `df` : `pd.DataFrame`
+        A samples dataframe.
+
+    Returns
+    -------
+    `pd.DataFrame`
+        The dataframe, with categorical columns as objects.
+    """
+    return df.astype({c: object for c in CATEGORICAL_FIELDS if c in df})
+
+
+def get_group_index(df: pd.DataFrame) -> dict[str, set[int]]:
+    """Return the samples of each group of the samples dataframe.
+
+    Parameters
+    ----------
+    `df` : `pd.DataFrame`
+        A samples dataframe.
+
+    Returns
+    -------
+    `dict[str, set[int]]`
+        The sample ids of each group label.
+    """
+    index: dict[str, set[int]] = {}
+    if "metadata.groups" in df:
+        for sid, groups in df["metadata.groups"].items():
+            for group in groups:
+                index.setdefault(group, set()).add(sid)
+    return index
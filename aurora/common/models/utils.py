@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from typing import Any
+
+import numpy as np
 import pandas as pd
 from pandas.io.formats.style import Styler
 from pydantic import BaseModel, ValidationError
@@ -54,78 +57,45 @@ def validate(data: dict, schema: BaseModel) -> BaseModel | None:
         return None
 
 
-def to_pd_query(query_dict: dict) -> str | None:
-    """Return a query dictionary as a `pandas` query.
-
-    Convert a dictionary of query conditions to a string of
-    "and"-separated `pd.DataFrame`-compatible conditions.
+def get_mask(df: pd.DataFrame, field: str, value: Any) -> np.ndarray:
+    """Return the boolean mask of a query condition.
 
-    NOTE: `df.query("tuple()")` returns the full table.
+    `from` and `to` bound the creation datetime, list-like values
+    test membership, and other values test equality. The `id` field
+    refers to the index.
 
     Parameters
     ----------
-    `query_dict` : `dict`
-        A dictionary of query conditions.
+    `df` : `pd.DataFrame`
+        The samples dataframe.
+    `field` : `str`
+        The queried field.
+    `value` : `Any`
+        The queried value(s).
 
     Returns
     -------
-    `Optional[str]`
-        An "and"-separated string representation of the query
-        required for querying a `pd.DataFrame` object.
+    `np.ndarray`
+        The mask of the rows satisfying the condition.
 
     Example
     -------
-    >>> to_pd_query({"batch": "12345", "specs.manufacturer": "BIG-MAP"})
-    >>> "(`batch` == "12345") and (`specs.manufacturer` == "BIG-MAP")"
+    >>> get_mask(df, "specs.manufacturer", ["BIG-MAP", "Empa"])
+    >>> array([ True, False,  True, ...])
     """
 
-    query_args: list[str] = []
+    if field in ("from", "to"):
+        dates = df["metadata.creation_datetime"]
+        bound = pd.to_datetime(value)
+        mask = dates >= bound if field == "from" else dates <= bound
+        return mask.to_numpy()
 
-    if from_ := query_dict.pop("from", None):
-        query_args.append(
-            f"(`metadata.creation_datetime` >= \"{pd.to_datetime(from_)}\")")
-    if to := query_dict.pop("to", None):
-        query_args.append(
-            f"(`metadata.creation_datetime` <= \"{pd.to_datetime(to)}\")")
+    column = df.index if field == "id" else df[field]
 
-    processed = quote_query_strings(query_dict)
-    query_args.extend(f"(`{k}` == {v})" for k, v in processed.items())
-    return " and ".join(query_args)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return np.asarray(column.isin(list(value)))
 
-
-def quote_query_strings(query_dict: dict) -> dict:
-    """Enforce quotes on string queries.
-
-    Parameters
-    ----------
-    `query_dict` : `dict`
-        Dictionary containing query key|value pairs.
-
-    Returns
-    -------
-    `dict`
-        The processed dictionary, with strings wrapped in quotes.
-    """
-    return {
-        k: [cast(v_) for v_ in v] if isinstance(v, list) else cast(v)
-        for k, v in query_dict.items() if v is not None
-    }
-
-
-def cast(v: int | float | str) -> int | float | str:
-    """Return `int|float` as is; surround in quotes if `str`.
-
-    Parameters
-    ----------
-    `v` : `Union[int, float, str]`
-        The value to cast.
-
-    Returns
-    -------
-    `Union[int, float, str]`
-        The casted value.
-    """
-    return f"'{v}'" if isinstance(v, str) else v
+    return np.asarray(column == value)
 
 
 def style(df: pd.DataFrame) -> Styler:
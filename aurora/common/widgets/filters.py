@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Callable
 
 import ipywidgets as ipw
@@ -41,6 +42,9 @@ BUTTON_LAYOUT = {
     "margin": "0 20px",
 }
 
+# seconds within which filter changes are coalesced
+DEBOUNCE_DELAY = 0.3
+
 FIELDS = {
     "Batch": "metadata.batch",
     "Sub-batch": "metadata.subbatch",
@@ -100,6 +104,7 @@ class Filters(ipw.Accordion):
         """docstring"""
 
         self.__model = model
+        self.__pending: asyncio.TimerHandle | None = None
 
         self.group = ipw.Dropdown(
             layout=GROUP_LAYOUT,
@@ -188,7 +193,27 @@ class Filters(ipw.Accordion):
         }
 
     def on_change(self, _=None) -> None:
+        """Schedule the filter update, coalescing bursts of changes.
+
+        Changes within `DEBOUNCE_DELAY` seconds of each other trigger a
+        single update. Without a running event loop, e.g. outside of a
+        kernel, the update is applied immediately.
+        """
+
+        if self.__pending is not None:
+            self.__pending.cancel()
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.apply_changes()
+            return
+
+        self.__pending = loop.call_later(DEBOUNCE_DELAY, self.apply_changes)
+
+    def apply_changes(self) -> None:
         """docstring"""
+        self.__pending = None
         self.update_grid()
         self.changed += 1
 
@@ -228,37 +253,24 @@ class Filters(ipw.Accordion):
 
     def _build_grid_options(self) -> None:
         """docstring"""
+
+        facets = self.__model.get_facets(
+            self.current_state,
+            [filter.field for filter in self.grid_filters],
+        )
+
         for filter in self.grid_filters:
             value = filter.value
-            filter.options = self._build_filter_options(filter.field)
+            filter.options = self._build_filter_options(
+                facets.get(filter.field, []))
             filter.value = value
 
     def _build_filter_options(
         self,
-        field: str,
+        counts: list[tuple[Any, int]],
     ) -> list[tuple[str, Any]]:
         """docstring"""
-
-        if not self.__model.has_samples():
-            return []
-
-        query = self.current_state
-        query.pop(field, None)
-        result = self.__model.query(query, project=[field])
-
-        value_counts = result[field].value_counts()
-
-        options_pairs: list[tuple[str, Any]] = []
-
-        result = self.__model.query({}, project=[field])
-
-        relevant_indexes = result[field].unique()
-
-        for index_label in relevant_indexes:
-            count = value_counts.get(index_label, 0)
-            options_pairs.append((f"{index_label} [{count}]", index_label))
-
-        return options_pairs
+        return [(f"{value} [{count}]", value) for value, count in counts]
 
     def _subscribe_observers(self) -> None:
         """docstring"""
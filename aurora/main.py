@@ -9,6 +9,7 @@ from aurora.experiment.controller import ExperimentController
 from aurora.experiment.model import ExperimentModel
 from aurora.experiment.view import ExperimentView
 from aurora.inventory import InventoryManager
+from aurora.results.cache import ResultsCache
 from aurora.results.model import ResultsModel
 from aurora.results.presenter import ResultsPresenter
 from aurora.results.view import ResultsView
@@ -16,6 +17,12 @@ from aurora.results.view import ResultsView
 DATA_DIR = "data"
 AVAILABLE_SAMPLES_FILE = "available_samples.json"
 AVAILABLE_PROTOCOLS_FILE = 'available_protocols.json'
+RESULTS_CACHE_DIR = f"{DATA_DIR}/cache/results"
+RESULTS_CACHE_SIZE = 2**30  # bytes
+ANALYSIS_WORKERS = 1  # > 1 to analyze experiments in a process pool
+PREFETCH_LIMIT = 16  # max experiments queued for background analysis
+RESULTS_MEMORY_SIZE = 2**29  # bytes
+COMPACT_RESULTS = False  # single precision in-memory series, except time
 
 MAIN_LAYOUT = {
     'width': '100%',
@@ -122,7 +129,14 @@ class MainPanel(ipw.VBox):
         `ResultsView`
             The results view as an `ipw.VBox`.
         """
-        model = ResultsModel()
+        cache = ResultsCache(RESULTS_CACHE_DIR, RESULTS_CACHE_SIZE)
+        model = ResultsModel(
+            cache,
+            ANALYSIS_WORKERS,
+            PREFETCH_LIMIT,
+            RESULTS_MEMORY_SIZE,
+            COMPACT_RESULTS,
+        )
         view = ResultsView()
         _ = ResultsPresenter(model, view)
         return view
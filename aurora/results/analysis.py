@@ -0,0 +1,155 @@
+"""
+Cycling analysis of experiments, split into two stages.
+
+Loading the experiment input requires the AiiDA session and must run
+serially in the main process. Processing the loaded input is pure and
+may run concurrently in a process pool.
+
+The stages follow `aiida_aurora.utils.cycling_analysis`.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from aiida.orm import CalcJobNode, RemoteData, SinglefileData
+from aiida_aurora.utils.cycling_analysis import (add_monitor_details,
+                                                 get_data_from_snapshot,
+                                                 get_monitors)
+from aiida_aurora.utils.parsers import get_data_from_raw, post_process_data
+
+CYCLER_PROCESS_TYPE = "aiida.calculations:aurora.cycler"
+
+
+def load_experiment(node: CalcJobNode) -> tuple[str, dict]:
+    """Return the analysis log header and the raw input of the node.
+
+    Parameters
+    ----------
+    `node` : `CalcJobNode`
+        The experiment node.
+
+    Returns
+    -------
+    `tuple[str, dict]`
+        The log header and the picklable analysis input.
+
+    Raises
+    ------
+    `TypeError`
+        If `node` is not a `BatteryCyclerExperiment`.
+    """
+
+    if node.process_type != CYCLER_PROCESS_TYPE:
+        raise TypeError("`node` is not a `BatteryCyclerExperiment`")
+
+    log = f"CalcJob:   <{node.pk}> '{node.label}'\n"
+    log += f"Sample:    {node.inputs.battery_sample.label}\n"
+    log += "Monitored: "
+
+    if monitors := get_monitors(node):
+        log += "True"
+        log += add_monitor_details(monitors)
+    else:
+        log += "False"
+
+    warning = ""
+
+    if node.exit_status:
+        warning += "WARNING: "
+        generic = "job killed by monitor"
+        warning += f"{node.exit_message}" if node.exit_message else generic
+        warning += "\n\n"
+
+    try:
+        source = load_source(node)
+    except Exception as err:
+        source = {"error": str(err)}
+
+    return log, {"warning": warning, **source}
+
+
+def load_source(node: CalcJobNode) -> dict:
+    """Return the raw data of the node in a picklable form."""
+
+    if node.exit_status is None:
+        return {"snapshot": node.base.extras.get("snapshot", {})}
+
+    if "results" in node.outputs:
+        results = node.outputs.results
+        return {
+            "t": results.get_array("step0_uts"),
+            "Ewe": results.get_array("step0_Ewe_n"),
+            "I": results.get_array("step0_I_n"),
+        }
+
+    if "raw_data" in node.outputs:
+        return {"json": read_results_file(node.outputs.raw_data)}
+
+    if "retrieved" in node.outputs:
+        return {"json": read_results_file(node.outputs.retrieved)}
+
+    if "remote_folder" in node.outputs:
+        return {"json": read_remote_snapshot(node.outputs.remote_folder)}
+
+    return {}
+
+
+def read_results_file(source: SinglefileData) -> str:
+    """Return the content of the retrieved results file, if present."""
+    if "results.json" in source.base.repository.list_object_names():
+        return source.base.repository.get_object_content(
+            "results.json",
+            mode="r",
+        )
+    return ""
+
+
+def read_remote_snapshot(source: RemoteData) -> str:
+    """Return the content of the remote snapshot file, if accessible."""
+    try:
+        remote_path = source.attributes["remote_path"]
+        return Path(f"{remote_path}/snapshot.json").read_text()
+    except Exception:
+        return ""
+
+
+def process_experiment(source: dict) -> tuple[dict, str]:
+    """Post-process the raw input of an experiment.
+
+    Runs without the AiiDA session, such that it may be executed in
+    a separate process.
+
+    Parameters
+    ----------
+    `source` : `dict`
+        The analysis input prepared by `load_experiment`.
+
+    Returns
+    -------
+    `tuple[dict, str]`
+        The post-processed data and the warning or error message.
+    """
+    try:
+        if "error" in source:
+            raise RuntimeError(source["error"])
+        return process_source(source), source["warning"]
+    except Exception as err:
+        return {}, f"*** ERROR ***\n\n{str(err)}"
+
+
+def process_source(source: dict) -> dict:
+    """Return the post-processed data of the raw input."""
+
+    if "snapshot" in source:
+        return get_data_from_snapshot(source["snapshot"])
+
+    if "t" in source:
+        t = source["t"] - source["t"][0]
+        return post_process_data(t, source["Ewe"], source["I"])
+
+    if source.get("json"):
+        return get_data_from_raw(json.loads(source["json"]))
+
+    return {}
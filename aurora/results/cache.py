@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from aiida.orm import CalcJobNode
+
+LOG_FILE = "log.txt"
+
+
+class ResultsCache():
+    """
+    A persistent on-disk cache of cycling analysis results.
+
+    Each experiment is stored as a directory named after the experiment
+    node UUID and the modification time of its results, such that new
+    results invalidate the stored analysis. Each series is stored as a
+    separate `.npy` file and loaded memory-mapped, such that slicing a
+    window or decimating a series only pages in the accessed points.
+    Least recently used entries are evicted once the total size of the
+    cache exceeds `max_size` bytes.
+    """
+
+    def __init__(self, directory: str, max_size: int = 2**30) -> None:
+        """docstring"""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    def load(self, node: CalcJobNode) -> tuple[dict, str] | None:
+        """Return the cached `(data, log)` of the node, if up to date."""
+        path = self.get_path(node)
+        return self.__read(path) if path.is_dir() else None
+
+    def store(self, node: CalcJobNode, data: dict, log: str) -> None:
+        """Store the analysis of the node, replacing stale entries."""
+
+        if not data:
+            return
+
+        self.discard(node)
+
+        path = self.get_path(node)
+        temp = path.with_name(f"{path.name}.tmp")
+
+        shutil.rmtree(temp, ignore_errors=True)
+        temp.mkdir()
+
+        for key, array in data.items():
+            np.save(temp / f"{key}.npy", np.asarray(array))
+
+        (temp / LOG_FILE).write_text(log)
+
+        os.replace(temp, path)
+
+        self.evict()
+
+    def discard(self, node: CalcJobNode) -> None:
+        """Remove all cached entries of the node."""
+        for path in self.__get_entries(f"{node.uuid}_*"):
+            shutil.rmtree(path, ignore_errors=True)
+
+    def evict(self) -> None:
+        """Remove least recently used entries until within size limit."""
+
+        entries = [(path, path.stat().st_mtime, get_size(path))
+                   for path in self.__get_entries("*")]
+        entries.sort(key=lambda entry: entry[1])
+
+        size = sum(entry_size for *_, entry_size in entries)
+
+        for path, _, entry_size in entries:
+            if size <= self.max_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            size -= entry_size
+
+    def get_path(self, node: CalcJobNode) -> Path:
+        """Return the cache path of the node's current results."""
+        timestamp = int(get_results_mtime(node).timestamp() * 1e6)
+        return self.directory / f"{node.uuid}_{timestamp}"
+
+    ###########
+    # PRIVATE #
+    ###########
+
+    def __get_entries(self, pattern: str) -> list[Path]:
+        """docstring"""
+        return [
+            path for path in self.directory.glob(pattern)
+            if path.is_dir() and path.suffix != ".tmp"
+        ]
+
+    def __read(self, path: Path) -> tuple[dict, str] | None:
+        """docstring"""
+
+        try:
+            log = (path / LOG_FILE).read_text()
+            data = {
+                file.stem: np.load(file, mmap_mode="r")
+                for file in path.glob("*.npy")
+            }
+        except Exception:
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+
+        os.utime(path)  # mark as recently used
+
+        return data, log
+
+
+def get_results_mtime(node: CalcJobNode) -> datetime:
+    """Return the latest modification time of the node's results.
+
+    Falls back to the modification time of the node itself if no
+    results `ArrayData` is attached, e.g. for monitored experiments.
+    """
+    if "results" in node.outputs:
+        return node.outputs.results.mtime
+    return node.mtime
+
+
+def get_size(path: Path) -> int:
+    """Return the total size of the files of the cache entry."""
+    return sum(file.stat().st_size for file in path.iterdir())
@@ -0,0 +1,172 @@
+"""
+Export of plotted series and experiment analyses to Parquet or CSV.
+
+Parquet export requires the optional `pyarrow` dependency, installed
+with the `export` extra. CSV export is always available.
+"""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Iterable
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+EXPORT_FORMATS = [
+    *([("Parquet", "parquet")] if pq else []),
+    ("CSV", "csv"),
+]
+
+# per-point series of the analysis, the rest being per-cycle
+POINT_KEYS = ("time", "Ewe", "I", "Q")
+
+Series = tuple[str, np.ndarray, np.ndarray]
+
+
+def export_series(path: str, series: Iterable[Series], fmt: str) -> str:
+    """Write the series to file in the requested format.
+
+    Parameters
+    ----------
+    `path` : `str`
+        The destination path, without extension.
+    `series` : `Iterable[tuple[str, np.ndarray, np.ndarray]]`
+        The `(name, x, y)` series to export.
+    `fmt` : `str`
+        The file format, one of `"parquet"` or `"csv"`.
+
+    Returns
+    -------
+    `str`
+        The path of the written file.
+
+    Raises
+    ------
+    `ValueError`
+        If the format is not supported.
+    """
+
+    if fmt == "parquet" and pq:
+        return write_parquet(f"{path}.parquet", series)
+
+    if fmt == "csv":
+        return write_csv(f"{path}.csv", series)
+
+    raise ValueError(f"unsupported export format '{fmt}'")
+
+
+def write_parquet(path: str, series: Iterable[Series]) -> str:
+    """Write the series in long format, one row group per series."""
+
+    schema = pa.schema([
+        ("series", pa.string()),
+        ("x", pa.float64()),
+        ("y", pa.float64()),
+    ])
+
+    with pq.ParquetWriter(path, schema) as writer:
+        for name, x, y in series:
+            writer.write_table(
+                pa.table(
+                    {
+                        "series": pa.repeat(name, len(x)),
+                        "x": np.asarray(x, dtype=float),
+                        "y": np.asarray(y, dtype=float),
+                    },
+                    schema=schema,
+                ),
+                row_group_size=max(len(x), 1),
+            )
+
+    return path
+
+
+def write_csv(path: str, series: Iterable[Series]) -> str:
+    """Write the series side by side, as `<name>_x` and `<name>_y`."""
+
+    columns = []
+
+    for name, x, y in series:
+        columns.append(pd.Series(x, name=f"{name}_x", copy=False))
+        columns.append(pd.Series(y, name=f"{name}_y", copy=False))
+
+    df = pd.concat(columns, axis=1) if columns else pd.DataFrame()
+
+    df.to_csv(path, index=False)
+
+    return path
+
+
+def open_archive(path: str | Path, fmt: str) -> ZipFile:
+    """Open a zip archive for writing exported experiments.
+
+    Parquet files are already compressed and are stored as is.
+    """
+    compression = ZIP_STORED if fmt == "parquet" else ZIP_DEFLATED
+    return ZipFile(path, "w", compression=compression)
+
+
+def write_experiment(
+    archive: ZipFile,
+    eid: int,
+    data: dict,
+    log: str,
+    fmt: str,
+) -> None:
+    """Write the analysis of the experiment to the archive.
+
+    The experiment is written to its own folder as a table of the raw
+    per-point series, a table of the per-cycle results, and the log.
+    Only one experiment is held in memory at a time.
+
+    Parameters
+    ----------
+    `archive` : `ZipFile`
+        The archive opened with `open_archive`.
+    `eid` : `int`
+        The experiment id.
+    `data` : `dict`
+        The post-processed data of the experiment.
+    `log` : `str`
+        The analysis log of the experiment.
+    `fmt` : `str`
+        The table format, one of `"parquet"` or `"csv"`.
+    """
+
+    archive.writestr(f"{eid}/log.txt", log)
+
+    if not data:
+        return
+
+    points = pd.DataFrame({key: data[key] for key in POINT_KEYS})
+
+    cycles = pd.DataFrame({
+        key: pd.Series(array)
+        for key, array in data.items() if key not in POINT_KEYS
+    })
+
+    for name, df in (("points", points), ("cycles", cycles)):
+        archive.writestr(f"{eid}/{name}.{fmt}", get_table_bytes(df, fmt))
+
+
+def get_table_bytes(df: pd.DataFrame, fmt: str) -> bytes:
+    """Return the table serialized in the requested format."""
+
+    if fmt == "parquet" and pq:
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, index=False)
+        return buffer.getvalue()
+
+    if fmt == "csv":
+        return df.to_csv(index=False).encode()
+
+    raise ValueError(f"unsupported export format '{fmt}'")
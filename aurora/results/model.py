@@ -1,16 +1,49 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from multiprocessing import get_context
+from pathlib import Path
+from threading import Lock, RLock, Thread
+from typing import Iterator
 
 import pandas as pd
 from aiida.orm import CalcJobNode, Group, QueryBuilder, load_node
 from aiida_aurora.calculations import BatteryCyclerExperiment
-from traitlets import HasTraits, Unicode
+from aiida_aurora.data.battery import BatterySampleData
+from traitlets import HasTraits, Int, Unicode
 
 from aurora.common.groups import EXPERIMENTS_GROUP_PREFIX
 from aurora.time import TZ
 
-from .utils import get_experiment_sample_id, get_experiment_sample_node
+from .analysis import load_experiment, process_experiment
+from .cache import ResultsCache, get_results_mtime
+from .export import open_archive, write_experiment
+from .store import ResultsStore, compact
+from .utils import get_sample_id
+
+JOB_FIELDS = [
+    "id",
+    "label",
+    "ctime",
+    "attributes.process_state",
+    "extras.monitored",
+    "extras.flag",
+    "extras.status",
+]
+
+CATEGORICAL_FIELDS = [
+    "attributes.process_state",
+    "extras.flag",
+    "extras.status",
+]
+
+SAMPLE_FIELDS = [
+    "name",
+    "batch",
+    "subbatch",
+]
 
 
 class ResultsModel(HasTraits):
@@ -20,13 +53,134 @@ class ResultsModel(HasTraits):
 
     weights_file = Unicode("")
 
-    def __init__(self) -> None:
+    results_size = Int(0)
+
+    def __init__(
+        self,
+        cache: ResultsCache | None = None,
+        workers: int = 1,
+        prefetch_limit: int = 16,
+        memory_size: int = 2**29,
+        compact: bool = False,
+    ) -> None:
         """docstring"""
+        self.cache = cache
+        self.workers = workers
+        self.compact = compact
+        self.__pool: ProcessPoolExecutor | None = None
+        self.__pool_size = 0
+        self.__lock = RLock()
+        self.__queue_lock = Lock()
+        self.__running: dict[int, tuple[Future, CalcJobNode, str]] = {}
+        self.__prefetch_queue: deque[int] = deque(maxlen=prefetch_limit)
+        self.__prefetching = False
         self.experiments = pd.DataFrame()
-        self.results: dict[int, dict] = {}
+        self.results = ResultsStore(memory_size)
         self.weights: dict[int, dict[str, float]] = {}
 
-    def get_weights(self, eid: int) -> dict[str, float]:
+    def run_cycling_analyses(self, eids: list[int]) -> Iterator[int]:
+        """Analyze the experiments, yielding their ids as results arrive.
+
+        Results of terminated experiments are final and are reused as
+        is. Results of running experiments are reused while current,
+        otherwise refreshed from the latest monitor snapshot.
+
+        Nodes are loaded serially, as required by the AiiDA session.
+        If more than one worker is configured, the loaded data is
+        processed concurrently in a process pool. Snapshots are already
+        post-processed and truncated by the monitor, and are converted
+        in the main process.
+
+        Safe to call while prefetching, in which case experiments
+        analyzed in the background are waited for rather than
+        analyzed twice.
+
+        An experiment failing to be analyzed does not interrupt the
+        others. The error is stored as its results, to be reported,
+        and the analysis is retried on the next call.
+        """
+
+        pending: dict[Future, int] = {}
+
+        for eid in eids:
+            with self.__lock:
+                try:
+                    if future := self.__analyze(eid):
+                        pending[future] = eid
+                        continue
+                except Exception as err:
+                    self.__set_error(eid, err)
+            yield eid
+
+        for future in as_completed(pending):
+            eid = pending[future]
+            with self.__lock:
+                if self.__running.get(eid, (None, ))[0] is future:
+                    _, job_node, header = self.__running.pop(eid)
+                    try:
+                        data, message = future.result()
+                        self.__store_analysis(
+                            eid,
+                            job_node,
+                            header,
+                            data,
+                            message,
+                        )
+                    except Exception as err:
+                        self.__set_error(eid, err)
+            yield eid
+
+    def prefetch(self, eids: list[int]) -> None:
+        """Analyze the experiments in a background thread.
+
+        At most `prefetch_limit` experiments are queued, the oldest
+        requests being dropped in favor of the latest selection.
+        Experiments with final results are skipped.
+        """
+
+        with self.__queue_lock:
+
+            for eid in eids:
+                if self.has_final_results(eid):
+                    continue
+                if eid not in self.__prefetch_queue:
+                    self.__prefetch_queue.append(eid)
+
+            if self.__prefetch_queue and not self.__prefetching:
+                self.__prefetching = True
+                Thread(target=self.__prefetch, daemon=True).start()
+
+    def has_final_results(self, eid: int) -> bool:
+        """Check if the experiment has results that are final.
+
+        Results of running experiments and failed analyses are not
+        final, and are refreshed when next analyzed.
+        """
+        return eid in self.results and self.results[eid]["final"]
+
+    def export_experiments(
+        self,
+        eids: list[int],
+        path: str | Path,
+        fmt: str,
+    ) -> Iterator[int]:
+        """Export the analyses of the experiments to a zip archive.
+
+        Experiments are analyzed, or loaded from the cache, in batches
+        of one experiment per worker, and written one at a time,
+        yielding their ids as they are written. Only the inputs and
+        results of one batch are pending at a time.
+        """
+        size = max(self.workers, 1)
+        with open_archive(path, fmt) as archive:
+            for start in range(0, len(eids), size):
+                batch = eids[start:start + size]
+                for eid in self.run_cycling_analyses(batch):
+                    data, log = self.__get_full_results(eid)
+                    write_experiment(archive, eid, data, log, fmt)
+                    yield eid
+
+    def get_weights(self, sample: BatterySampleData) -> dict[str, float]:
         """docstring"""
 
         defaults = {
@@ -36,12 +190,12 @@ class ResultsModel(HasTraits):
 
         if self.weights:
             try:
-                return self.fetch_weights_from_file(eid)
+                return self.fetch_weights_from_file(sample)
             except Exception:
                 return defaults
 
         try:
-            return fetch_weights_from_node(eid)
+            return fetch_weights_from_node(sample)
         except Exception:
             return defaults
 
@@ -77,9 +231,12 @@ class ResultsModel(HasTraits):
             axis=1,
         ).reindex(sample_id).to_dict("index")
 
-    def fetch_weights_from_file(self, eid: int) -> dict[str, float]:
+    def fetch_weights_from_file(
+        self,
+        sample: BatterySampleData,
+    ) -> dict[str, float]:
         """docstring"""
-        sample_id = get_experiment_sample_id(eid)
+        sample_id = get_sample_id(sample)
         return self.weights[sample_id]
 
     def reset_weights(self) -> None:
@@ -96,15 +253,44 @@ class ResultsModel(HasTraits):
         """docstring"""
 
         group_label = f"{EXPERIMENTS_GROUP_PREFIX}/{group}"
-        if experiments := query_jobs(group_label, last_days, active_only):
-            df = pd.DataFrame(experiments).sort_values("id")
+        df = query_jobs(group_label, last_days, active_only)
+        df = df.set_index("id").sort_index()
+
+        if not df.empty:
             ctime = df["ctime"].dt.strftime(r"%Y-%m-%d %H:%m:%S")
             df["ctime"] = ctime
-        else:
-            df = pd.DataFrame()
+
+        for field in CATEGORICAL_FIELDS:
+            df[field] = df[field].fillna("").astype("category")
 
         self.experiments = df
 
+    def get_experiment_extras(self, eid: int, field: str) -> str:
+        """Return the extras field of the experiment.
+
+        Returns an empty string if the experiment is no longer listed.
+        """
+        if eid not in self.experiments.index:
+            return ""
+        return self.experiments.at[eid, f"extras.{field}"]
+
+    def get_sample_metadata(self, eid: int) -> dict[str, str] | None:
+        """Return the sample metadata of the experiment, if listed.
+
+        Read from the sample fields queried along with the experiments.
+        """
+
+        if eid not in self.experiments.index:
+            return None
+
+        columns = [f"sample.{field}" for field in SAMPLE_FIELDS]
+        row = self.experiments.loc[eid, columns]
+
+        if row.isna().any():
+            return None
+
+        return dict(zip(SAMPLE_FIELDS, row))
+
     @staticmethod
     def get_groups() -> list[str]:
         """docstring"""
@@ -165,19 +351,166 @@ class ResultsModel(HasTraits):
                 "marked_for_death": False,
             })
 
-    def get_experiment_extras(self, eid: int, field: str) -> str:
+    ###########
+    # PRIVATE #
+    ###########
+
+    def __analyze(self, eid: int) -> Future | None:
+        """Analyze the experiment, unless its results are current.
+
+        Returns the pending future if submitted to the process pool.
+        """
+
+        if eid in self.__running:
+            return self.__running[eid][0]
+
+        if self.has_final_results(eid):
+            return None
+
+        job_node: CalcJobNode = load_node(pk=eid)
+        mtime = get_results_mtime(job_node)
+
+        if eid in self.results and self.results[eid]["mtime"] == mtime:
+            return None
+
+        if self.cache and (cached := self.cache.load(job_node)):
+            self.__set_results(eid, job_node, *cached)
+            return None
+
+        try:
+            header, source = load_experiment(job_node)
+        except Exception as err:
+            header, source = "", {"error": str(err)}
+
+        # snapshots are post-processed and truncated by the monitor
+        if "snapshot" not in source and self.workers > 1:
+            future = self.__get_pool().submit(process_experiment, source)
+            self.__running[eid] = (future, job_node, header)
+            return future
+        else:
+            data, message = process_experiment(source)
+            self.__store_analysis(eid, job_node, header, data, message)
+
+        return None
+
+    def __prefetch(self) -> None:
+        """Analyze queued experiments until the queue is exhausted."""
+
+        while True:
+
+            with self.__queue_lock:
+                if not self.__prefetch_queue:
+                    self.__prefetching = False
+                    return
+                size = min(self.workers, len(self.__prefetch_queue))
+                batch = [self.__prefetch_queue.popleft() for _ in range(size)]
+
+            for _ in self.run_cycling_analyses(batch):
+                pass
+
+    def __store_analysis(
+        self,
+        eid: int,
+        job_node: CalcJobNode,
+        header: str,
+        data: dict,
+        message: str,
+    ) -> None:
+        """docstring"""
+
+        log = f"{header}\n{message}"
+
+        # results of running experiments are replaced on every refresh
+        if self.cache and job_node.is_terminated:
+            self.cache.store(job_node, data, log)
+            # serve the stored series memory-mapped rather than in memory
+            if not self.compact and (cached := self.cache.load(job_node)):
+                data = cached[0]
+
+        self.__set_results(eid, job_node, data, log)
+
+    def __set_results(
+        self,
+        eid: int,
+        job_node: CalcJobNode,
+        data: dict,
+        log: str,
+    ) -> None:
+        """Set the in-memory results of the experiment.
+
+        If `compact` is set, only this in-memory copy is compacted,
+        such that the cache and exports keep full precision. Results
+        of running experiments are not compacted, as they are replaced
+        on the next refresh.
+        """
+        final = job_node.is_terminated
+        self.results[eid] = {
+            "data": compact(data) if self.compact and final else data,
+            "log": log,
+            "mtime": get_results_mtime(job_node),
+            "final": final,
+        }
+        self.results_size = self.results.size
+
+    def __set_error(self, eid: int, err: Exception) -> None:
+        """Set the error of a failed analysis as the experiment results.
+
+        The error is neither final nor current, such that the experiment
+        is analyzed again when next requested, e.g. by a plot.
+        """
+        self.results[eid] = {
+            "data": {},
+            "log": f"*** ERROR ***\n\n{str(err)}",
+            "mtime": None,
+            "final": False,
+        }
+        self.results_size = self.results.size
+
+    def __get_full_results(self, eid: int) -> tuple[dict, str]:
+        """Return the full precision `(data, log)` of the experiment.
+
+        Compacted in-memory results are read back from the cache, or
+        analyzed again if not cached.
+        """
+
+        results = self.results[eid]
+
+        if not self.compact or not results["data"]:
+            return results["data"], results["log"]
+
+        job_node: CalcJobNode = load_node(pk=eid)
+
+        if self.cache and (cached := self.cache.load(job_node)):
+            return cached
+
+        header, source = load_experiment(job_node)
+        data, message = process_experiment(source)
+
+        return data, f"{header}\n{message}"
+
+    def __get_pool(self) -> ProcessPoolExecutor:
         """docstring"""
-        query = f"id == {eid}"
-        column = f"extras.{field}"
-        return self.experiments.query(query)[column].values[0]
+        if self.__pool is None or self.__pool_size != self.workers:
+            if self.__pool is not None:
+                self.__pool.shutdown(wait=False)
+            self.__pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=get_context("spawn"),
+            )
+            self.__pool_size = self.workers
+        return self.__pool
 
 
 def query_jobs(
     group: str,
     last_days: int,
     active_only: bool,
-) -> list[BatteryCyclerExperiment]:
-    """docstring"""
+) -> pd.DataFrame:
+    """Return the experiments of the group along with their sample.
+
+    The sample metadata is joined in the same query, such that the
+    listing requires a single database round trip.
+    """
 
     qb = QueryBuilder()
 
@@ -187,15 +520,13 @@ def query_jobs(
         BatteryCyclerExperiment,
         with_group="g",
         tag="jobs",
-        project=[
-            "id",
-            "label",
-            "ctime",
-            "attributes.process_state",
-            "extras.monitored",
-            "extras.flag",
-            "extras.status",
-        ],
+        project=JOB_FIELDS,
+    )
+
+    qb.append(
+        BatterySampleData,
+        with_outgoing="jobs",
+        project=[f"attributes.metadata.{field}" for field in SAMPLE_FIELDS],
     )
 
     qb.add_filter(
@@ -232,13 +563,14 @@ def query_jobs(
 
     qb.order_by({"jobs": {"ctime": "desc"}})
 
-    return [query["jobs"] for query in qb.dict()]
+    columns = [*JOB_FIELDS, *(f"sample.{field}" for field in SAMPLE_FIELDS)]
+
+    return pd.DataFrame(qb.all(), columns=columns)
 
 
-def fetch_weights_from_node(eid: int) -> dict[str, float]:
+def fetch_weights_from_node(sample: BatterySampleData) -> dict[str, float]:
     """docstring"""
-    node = get_experiment_sample_node(eid)
-    composition = node.attributes["specs"]["composition"]
+    composition = sample.attributes["specs"]["composition"]
     return {
         "anode_mass": composition["anode"]["weight"]["net"],
         "cathode_mass": composition["cathode"]["weight"]["net"],
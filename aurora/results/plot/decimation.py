@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def decimate(
+    x: np.ndarray,
+    y: np.ndarray,
+    points: int,
+    xlim: tuple[float, float] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return a shape-preserving decimation of the series.
+
+    If `xlim` is provided, only the points of the series within the
+    x-limits (padded by one point on each side) are decimated, such
+    that zooming in restores the full resolution. As x need not be
+    monotonic, e.g. capacity over cycles, the window may consist of
+    several runs of points, separated in the result by `NaN` such
+    that no line joins them.
+
+    Parameters
+    ----------
+    `x` : `np.ndarray`
+        The x-coordinates of the series.
+    `y` : `np.ndarray`
+        The y-coordinates of the series.
+    `points` : `int`
+        The target number of points.
+    `xlim` : `tuple[float, float] | None`
+        The visible x-limits, `None` for the full series.
+
+    Returns
+    -------
+    `tuple[np.ndarray, np.ndarray]`
+        The decimated series.
+    """
+
+    if xlim is None:
+        index = get_min_max_indices(y, points)
+        return x[index], y[index]
+
+    inside = (x >= xlim[0]) & (x <= xlim[1])
+
+    if not inside.any():
+        index = get_min_max_indices(y, points)
+        return x[index], y[index]
+
+    window = inside.copy()
+    window[1:] |= inside[:-1]
+    window[:-1] |= inside[1:]
+
+    window_index = np.flatnonzero(window)
+    kept = get_min_max_indices(y[window_index], points)
+    index = window_index[kept]
+
+    wx, wy = x[index], y[index]
+
+    # break the line between runs of the window
+    runs = np.cumsum(np.diff(window_index, prepend=window_index[0]) > 1)
+    gaps = np.flatnonzero(np.diff(runs[kept]))
+
+    if gaps.size:
+        wx = np.insert(wx.astype(float), gaps + 1, np.nan)
+        wy = np.insert(wy.astype(float), gaps + 1, np.nan)
+
+    return wx, wy
+
+
+def get_min_max_indices(y: np.ndarray, points: int) -> np.ndarray:
+    """Return the indices of the extrema of evenly sized buckets.
+
+    The series is split into `points // 2` buckets, each represented
+    by its minimum and maximum in order of appearance. The first and
+    last points are always kept.
+
+    Parameters
+    ----------
+    `y` : `np.ndarray`
+        The series to decimate.
+    `points` : `int`
+        The target number of points.
+
+    Returns
+    -------
+    `np.ndarray`
+        The sorted indices of the retained points.
+    """
+
+    n = len(y)
+
+    if n <= max(points, 2):
+        return np.arange(n)
+
+    buckets = max(points // 2, 1)
+    size = -(-n // buckets)  # ceiling division
+
+    padded = np.empty(buckets * size, dtype=y.dtype)
+    padded[:n] = y
+    padded[n:] = y[-1]
+    padded = padded.reshape(buckets, size)
+
+    offsets = np.arange(buckets) * size
+    extrema = np.stack((
+        offsets + padded.argmin(axis=1),
+        offsets + padded.argmax(axis=1),
+    ))
+
+    index = np.sort(np.minimum(extrema, n - 1), axis=0).T.ravel()
+
+    return np.unique(np.concatenate(([0], index, [n - 1])))
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+from itertools import chain
+from typing import Iterator
+
 import ipywidgets as ipw
-from aiida.orm import load_node
-from aiida_aurora.utils.cycling_analysis import cycling_analysis
+import pandas as pd
+from aiida_aurora.data.battery import BatterySampleData
 from IPython.display import display
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
-from pandas.io.formats.style import Styler
 
 from ..model import ResultsModel
+from ..store import SeriesStore
+from ..utils import get_experiment_samples
+
+RAW_DATA_COLUMNS = {
+    "time": "Time (s)",
+    "I": "I (A)",
+    "Ewe": "Ewe (V)",
+}
 
 
 class PlotModel():
@@ -18,6 +28,11 @@ class PlotModel():
     """
     has_ax2 = False
 
+    RAW_DATA_PAGE_SIZE = 500
+
+    # bytes of derived series kept in memory across control states
+    DERIVED_SIZE = 2**28
+
     COLORS = {
         False: [
             "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b",
@@ -40,6 +55,16 @@ class PlotModel():
         self.__results_model = results_model
         self.experiment_ids = experiment_ids
         self.data: dict[int, dict] = {}
+        self.samples: dict[int, BatterySampleData] = {}
+        self.metadata = {
+            eid: metadata
+            for eid in experiment_ids
+            if (metadata := results_model.get_sample_metadata(eid))
+        }
+        self.weights: dict[int, dict[str, float]] = {}
+
+        # plotted series keyed by experiment id and control state
+        self.derived = SeriesStore(self.DERIVED_SIZE)
 
         self.fig: Figure
         self.ax: Axes
@@ -56,38 +81,60 @@ class PlotModel():
             handler=self.__reset_weights,
         )
 
-    def fetch_data(self, eid: int) -> None:
-        """docstring"""
+    def fetch_data(self) -> Iterator[int]:
+        """Fetch the data of all experiments, yielding ids as it arrives.
 
-        if eid in self.__results_model.results:
-            self.data[eid] = self.__results_model.results[eid]["data"]
-            self.display_experiment_info(eid)
-            return
+        Final results are yielded first, followed by the experiments
+        analyzed on demand. Results of running experiments are passed
+        through the analysis, such that they are refreshed if outdated.
+        """
 
-        self.run_cycling_analysis(eid)
+        results = self.__results_model.results
+        is_final = self.__results_model.has_final_results
 
-    def run_cycling_analysis(self, eid: int) -> None:
-        """docstring"""
-        job_node = load_node(pk=eid)
-        data, log, raw = cycling_analysis(job_node)
-        self.__results_model.results[eid] = {
-            "data": data,
-            "log": log,
-            "raw": raw,
-        }
-        self.data[eid] = self.__results_model.results[eid]["data"]
-        self.display_experiment_info(eid)
+        stored = [eid for eid in self.experiment_ids if is_final(eid)]
+        missing = [eid for eid in self.experiment_ids if not is_final(eid)]
 
-    def get_weight(self, eid: int, electrode: str) -> int:
+        for eid in self.experiment_ids:
+            self.data.setdefault(eid, {})  # preserve experiment order
+
+        analyzed = self.__results_model.run_cycling_analyses(missing)
+
+        for eid in chain(stored, analyzed):
+            self.data[eid] = results[eid]["data"]
+            yield eid
+
+    def get_weight(self, eid: int, electrode: str) -> float:
         """docstring"""
-        if "weights" not in self.data[eid]:
-            self.data[eid]["weights"] = self.__results_model.get_weights(eid)
-        return self.data[eid]["weights"].get(electrode.replace(" ", "_"), 1)
+        if eid not in self.weights:
+            sample = self.get_sample(eid)
+            self.weights[eid] = self.__results_model.get_weights(sample)
+        return self.weights[eid].get(electrode.replace(" ", "_"), 1)
+
+    def get_sample(self, eid: int) -> BatterySampleData:
+        """Return the sample of the experiment.
+
+        The samples of all experiments are fetched in a single query
+        on first access and memoized for the lifetime of the plot.
+        """
+        if not self.samples:
+            self.samples = get_experiment_samples(self.experiment_ids)
+        return self.samples[eid]
+
+    def get_sample_metadata(self, eid: int) -> dict[str, str]:
+        """Return the name, batch, and subbatch of the experiment sample.
+
+        Read from the experiments listing when the plot is created,
+        falling back to the sample node otherwise.
+        """
+        if eid not in self.metadata:
+            self.metadata[eid] = self.get_sample(eid)["metadata"]
+        return self.metadata[eid]
 
     def has_weights(self) -> bool:
         """docstring"""
         for eid in self.experiment_ids:
-            weights: dict = self.data[eid].get("weights", {})
+            weights = self.weights.get(eid, {})
             present = bool(weights)
             not_one = all(weight != 1. for weight in weights.values())
             if present and not_one:
@@ -108,9 +155,9 @@ class PlotModel():
 
     def display_experiment_info(self, eid: int) -> None:
         """docstring"""
-        _, log, raw = self.__results_model.results[eid].values()
-        print(log, end="")
-        self.__add_raw_data_dropdown(raw)
+        results = self.__results_model.results[eid]
+        print(results["log"], end="")
+        self.__add_raw_data_dropdown(eid)
 
     ###########
     # PRIVATE #
@@ -118,11 +165,10 @@ class PlotModel():
 
     def __reset_weights(self, _=None) -> None:
         """docstring"""
-        for eid in self.experiment_ids:
-            if eid in self.data and "weights" in self.data[eid]:
-                del self.data[eid]["weights"]
+        self.weights.clear()
+        self.derived.clear()
 
-    def __add_raw_data_dropdown(self, raw: Styler) -> None:
+    def __add_raw_data_dropdown(self, eid: int) -> None:
         """docstring"""
 
         output = ipw.Output()
@@ -137,7 +183,7 @@ class PlotModel():
         display(dropdown)
 
         dropdown.observe(
-            lambda change: self.__display_raw_data(change, output, raw),
+            lambda change: self.__display_raw_data(change, output, eid),
             "selected_index",
         )
 
@@ -145,11 +191,84 @@ class PlotModel():
         self,
         change: dict,
         output: ipw.Output,
-        raw: Styler,
+        eid: int,
     ) -> None:
-        """docstring"""
-        if change["new"] == 0:
-            with output:
-                display(raw)
-        else:
-            output.clear_output()
+        """Display the raw data of the experiment in pages.
+
+        Pages are rendered on demand from the analysis data, such
+        that no table is materialized until the dropdown is opened.
+        """
+
+        output.clear_output()
+
+        if change["new"] != 0:
+            return
+
+        data = self.data[eid]
+
+        with output:
+
+            if not data:
+                print("ERROR! Failed to find or parse output")
+                return
+
+            size = self.RAW_DATA_PAGE_SIZE
+            pages = max(-(-len(data["time"]) // size), 1)
+
+            page = ipw.BoundedIntText(
+                layout={
+                    "width": "150px",
+                },
+                description="Page:",
+                min=1,
+                max=pages,
+                value=1,
+            )
+
+            table = ipw.Output()
+
+            page.observe(
+                lambda change: display_raw_data_page(
+                    table,
+                    data,
+                    change["new"],
+                    size,
+                ),
+                "value",
+            )
+
+            display(
+                ipw.VBox([
+                    ipw.HBox([page, ipw.Label(f"of {pages}")]),
+                    table,
+                ]))
+
+            display_raw_data_page(table, data, 1, size)
+
+
+def display_raw_data_page(
+    output: ipw.Output,
+    data: dict,
+    page: int,
+    size: int,
+) -> None:
+    """Display a page of the raw data of an experiment."""
+
+    start = (page - 1) * size
+    df = pd.DataFrame({
+        label: data[key][start:start + size]
+        for key, label in RAW_DATA_COLUMNS.items()
+    })
+
+    output.clear_output(wait=True)
+
+    with output:
+        display(
+            df.style.set_properties(width="100vw").set_table_styles([
+                dict(
+                    selector="th, td",
+                    props=[
+                        ("text-align", "center"),
+                    ],
+                ),
+            ]).hide(axis="index"))
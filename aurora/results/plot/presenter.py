@@ -14,7 +14,6 @@ from traitlets import HasTraits, Unicode
 
 from aurora.time import TZ
 
-from ..utils import get_experiment_sample_node
 from .model import PlotModel
 from .view import PlotView
 
@@ -88,7 +87,7 @@ class PlotPresenter(HasTraits):
 
     def plot_series(self, eid: int, dataset: dict) -> None:
         """docstring"""
-        x, y = (np.array(a) for a in self.extract_data(dataset))
+        x, y = (np.asarray(a) for a in self.extract_data(dataset))
         label, color = self.get_series_properties(eid)
         line, = self.model.ax.plot(x, y, label=label, color=color)
         self.store_color(line)
@@ -240,12 +239,14 @@ class PlotPresenter(HasTraits):
         for i in range(number_of_pages):
             self._add_info_page(i)
 
-        for i, eid in enumerate(self.model.experiment_ids):
-            page_index = i // 8
-            info_tab = self._add_info_tab(page_index, eid)
+        info_tabs = {
+            eid: self._add_info_tab(i // 8, eid)
+            for i, eid in enumerate(self.model.experiment_ids)
+        }
 
-            with info_tab:
-                self.model.fetch_data(eid)
+        for eid in self.model.fetch_data():
+            with info_tabs[eid]:
+                self.model.display_experiment_info(eid)
 
     def _add_info_page(self, index: int) -> None:
         """docstring"""
@@ -368,8 +369,7 @@ class PlotPresenter(HasTraits):
 
     def _get_series_label(self, eid: int) -> str:
         """docstring"""
-        sample = get_experiment_sample_node(eid)
-        metadata = sample["metadata"]
+        metadata = self.model.get_sample_metadata(eid)
         return (f"{metadata['batch']}-{metadata['subbatch']}"
                 if self.view.sub_batch_toggle.value else metadata["name"])
 
@@ -23,6 +23,10 @@ class CapacityCyclePlotPresenter(MultiSeriesPlotPresenter):
 
     NORM_AX = "y"
 
+    SERIES_CONTROLS = ("electrode", "range", "points")
+
+    LINE_FORMAT = "."
+
     def __init__(
         self,
         model: PlotModel,
@@ -73,14 +77,11 @@ class CapacityCyclePlotPresenter(MultiSeriesPlotPresenter):
         x = dataset["cycle-number"]
         return (x, y)
 
-    def plot_series(self, eid: int, dataset: dict) -> None:
+    def derive_series(self, eid: int, dataset: dict) -> tuple:
         """docstring"""
-        x, y = (np.array(a) for a in self.extract_data(dataset))
-        y /= self.model.get_weight(eid, self.view.electrode.value)
-        x, y = self._down_select(x, y)
-        label, color = self.get_series_properties(eid)
-        line, = self.model.ax.plot(x, y, ".", label=label, color=color)
-        self.store_color(line)
+        x, y = super().derive_series(eid, dataset)
+        y = y / self.model.get_weight(eid, self.view.electrode.value)
+        return self._down_select(x, y)
 
     ###################
     # PRIVATE METHODS #
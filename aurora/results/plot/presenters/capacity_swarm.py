@@ -128,35 +128,38 @@ class CapacitySwarmPlotPresenter(StatisticalPlotPresenter):
         self.view.num_cycles.max = max_cycle
         num_cycles = self.view.num_cycles.value
 
-        df_dict: dict[str, list] = {
-            self.X_LABEL: [],
-            "hue": [],
-            self.Y_LABEL: [],
-        }
+        eids = list(dataset)
+        cycles = [dataset[eid]["cycle-number"][:num_cycles] for eid in eids]
+        capacities = [dataset[eid]["Qd"][:num_cycles] for eid in eids]
+        counts = [len(capacity) for capacity in capacities]
+
+        electrode = self.view.electrode.value
+        weights = np.array(
+            [self.model.get_weight(eid, electrode) for eid in eids],
+            dtype=float,
+        )
+        labels = np.array([self._get_series_label(eid) for eid in eids])
 
-        for eid, data in dataset.items():
-            label, _ = self.get_series_properties(eid)
-            weight = self.model.get_weight(eid, self.view.electrode.value)
-            factor = 1 / weight
-            for cycle, capacity in zip(
-                    data["cycle-number"][:num_cycles],
-                    data["Qd"][:num_cycles],
-            ):
-                df_dict["hue"].append(label)
-                df_dict[self.X_LABEL].append(cycle)
-                df_dict[self.Y_LABEL].append(capacity * factor)
-
-        data = pd.DataFrame(df_dict)
-        data = data.sort_values([self.X_LABEL, "hue"])
-        data = data.astype({"hue": "str"})
+        data = pd.DataFrame({
+            self.X_LABEL:
+            np.concatenate(cycles),
+            "hue":
+            np.repeat(labels, counts),
+            self.Y_LABEL:
+            np.concatenate(capacities) / np.repeat(weights, counts),
+        })
 
-        return data
+        return data.sort_values([self.X_LABEL, "hue"], kind="stable")
+
+    def get_plotted_data(self) -> pd.DataFrame:
+        """docstring"""
+        data = self.extract_data(self.model.data)
+        return data if data.empty else self._down_select(data)
 
     def plot_series(self, eid: int, dataset: dict) -> None:
         """docstring"""
-        data = self.extract_data(dataset)
+        data = self.get_plotted_data()
         if not data.empty:
-            data = self._down_select(data)
             self._plot_boxplot(data, draw=self.view.draw_box.value)
             self._plot_swarmplot(data, draw=self.view.draw_swarm.value)
 
@@ -189,20 +192,12 @@ class CapacitySwarmPlotPresenter(StatisticalPlotPresenter):
 
     def _get_swarm_copy(self, data: pd.DataFrame) -> pd.DataFrame:
         """docstring"""
-        swarm_data = data.copy(deep=True)
-        x_series = swarm_data[self.X_LABEL]
-        old_new_map = {old: new for new, old in enumerate(x_series.unique())}
-        swarm_data[self.X_LABEL] = x_series.apply(lambda old: old_new_map[old])
-        return swarm_data
+        codes, _ = pd.factorize(data[self.X_LABEL])
+        return data.assign(**{self.X_LABEL: codes})
 
     def __get_max_cycle(self, dataset: dict) -> int:
         """docstring"""
-        max_cycle = -1
-        for data in dataset.values():
-            last_cycle = len(data["Qd"])
-            if last_cycle > max_cycle:
-                max_cycle = last_cycle
-        return max_cycle
+        return max((len(data["Qd"]) for data in dataset.values()), default=-1)
 
     def _set_event_handlers(self) -> None:
         """docstring"""
@@ -299,9 +294,9 @@ class CapacitySwarmPlotPresenter(StatisticalPlotPresenter):
             with contextlib.suppress(Exception):
                 step = int(args[2])
 
-        _range = list(np.array(range(max_cycle + 1))[start:end:step])
+        cycles = np.arange(max_cycle + 1)[start:end:step]
 
-        return data.query(f"{self.X_LABEL} == {_range}") if _range else data
+        return self.__select_cycles(data, cycles)
 
     def _filter_points(self, data: pd.DataFrame) -> pd.DataFrame:
         """docstring"""
@@ -309,5 +304,13 @@ class CapacitySwarmPlotPresenter(StatisticalPlotPresenter):
         points = [int(p) for p in raw_list if p.strip("-").isnumeric()]
         max_cycle = data[self.X_LABEL].max() + 1
         valid = [p for p in set(points) if -max_cycle - 1 <= p < max_cycle]
-        _range = list(np.array(range(max_cycle))[valid])
-        return data.query(f"{self.X_LABEL} == {_range}") if _range else data
+        cycles = np.arange(max_cycle)[valid]
+        return self.__select_cycles(data, cycles)
+
+    def __select_cycles(
+        self,
+        data: pd.DataFrame,
+        cycles: np.ndarray,
+    ) -> pd.DataFrame:
+        """docstring"""
+        return data[data[self.X_LABEL].isin(cycles)] if cycles.size else data
@@ -21,6 +21,10 @@ class EfficiencyCyclePlotPresenter(MultiSeriesPlotPresenter):
 
     Y_LABEL = "Qd / Qc"
 
+    SERIES_CONTROLS = ("range", "points")
+
+    LINE_FORMAT = "."
+
     def __init__(
         self,
         model: PlotModel,
@@ -64,13 +68,9 @@ class EfficiencyCyclePlotPresenter(MultiSeriesPlotPresenter):
         y = Qd / Qc
         return (x, y)
 
-    def plot_series(self, eid: int, dataset: dict) -> None:
+    def derive_series(self, eid: int, dataset: dict) -> tuple:
         """docstring"""
-        x, y = (np.array(a) for a in self.extract_data(dataset))
-        x, y = self._down_select(x, y)
-        label, color = self.get_series_properties(eid)
-        line, = self.model.ax.plot(x, y, ".", label=label, color=color)
-        self.store_color(line)
+        return self._down_select(*super().derive_series(eid, dataset))
 
     ###################
     # PRIVATE METHODS #
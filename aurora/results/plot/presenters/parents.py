@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+from collections import Counter
+from typing import Iterator
+
+import ipywidgets as ipw
+import numpy as np
 import pandas as pd
-from matplotlib.collections import PathCollection
+from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
 
+from ...export import Series, export_series
+from ..decimation import decimate
+from ..model import PlotModel
 from ..presenter import PlotPresenter
+from ..view import PlotView
 
 
 class MultiSeriesPlotPresenter(PlotPresenter):
@@ -11,6 +21,123 @@ class MultiSeriesPlotPresenter(PlotPresenter):
     docstring
     """
 
+    # points per series - 0 to plot all points
+    MAX_POINTS = 0
+
+    # controls from which the plotted series are derived
+    SERIES_CONTROLS: tuple[str, ...] = ()
+
+    LINE_FORMAT = "-"
+
+    def __init__(
+        self,
+        model: PlotModel,
+        view: PlotView,
+    ) -> None:
+        """docstring"""
+
+        super().__init__(model, view)
+
+        # full resolution series of decimated lines
+        self.series: dict[Line2D, tuple[np.ndarray, np.ndarray]] = {}
+        self.lines: dict[int, list[Line2D]] = {}
+        self.window: tuple[float, float] | None = None
+
+        if self.MAX_POINTS:
+
+            resolution = ipw.BoundedIntText(
+                layout={
+                    "width": "200px",
+                },
+                description="resolution",
+                min=100,
+                max=10**7,
+                step=1000,
+                value=self.MAX_POINTS,
+            )
+
+            self.add_controls({"resolution": resolution})
+
+    def plot_series(self, eid: int, dataset: dict) -> None:
+        """docstring"""
+        x, y = self.get_series(eid, dataset)
+        label, color = self.get_series_properties(eid)
+        line = self.plot_line(
+            self.model.ax,
+            x,
+            y,
+            self.LINE_FORMAT,
+            label=label,
+            color=color,
+        )
+        self.lines[eid] = [line]
+        self.store_color(line)
+
+    def update_series(self, eid: int, dataset: dict) -> None:
+        """Update the plotted lines of the experiment in place."""
+        x, y = self.get_series(eid, dataset)
+        label, color = self.get_series_properties(eid)
+        line, = self.lines[eid]
+        self.set_line_data(line, x, y)
+        line.set(label=label, color=color)
+        self.store_color(line)
+
+    def get_series(self, eid: int, dataset: dict) -> tuple[np.ndarray, ...]:
+        """Return the derived series of the experiment.
+
+        Series are memoized on the state of the `SERIES_CONTROLS`,
+        such that revisiting a control state skips the derivation.
+        The least recently used series are dropped once over the
+        memory budget of `PlotModel.derived`.
+        """
+
+        key = (eid, *(getattr(self.view, name).value
+                      for name in self.SERIES_CONTROLS))
+
+        derived = self.model.derived
+
+        if key not in derived:
+            derived[key] = self.derive_series(eid, dataset)
+
+        return derived[key]
+
+    def derive_series(self, eid: int, dataset: dict) -> tuple:
+        """Return the plotted series of the experiment.
+
+        Series extracted as is are returned as views, such that only
+        derived copies count against the memory budget.
+        """
+        return tuple(np.asarray(a).view() for a in self.extract_data(dataset))
+
+    def plot_line(
+        self,
+        ax: Axes,
+        x: np.ndarray,
+        y: np.ndarray,
+        *args,
+        **kwargs,
+    ) -> Line2D:
+        """Plot the series, decimated to the current resolution."""
+
+        if not self.MAX_POINTS:
+            line, = ax.plot(x, y, *args, **kwargs)
+            return line
+
+        points = self.view.resolution.value
+        line, = ax.plot(*decimate(x, y, points, self.window), *args, **kwargs)
+        self.series[line] = (x, y)
+        return line
+
+    def set_line_data(self, line: Line2D, x: np.ndarray,
+                      y: np.ndarray) -> None:
+        """Replace the data of the line, decimated if applicable."""
+
+        if line in self.series:
+            self.series[line] = (x, y)
+            x, y = decimate(x, y, self.view.resolution.value, self.window)
+
+        line.set_data(x, y)
+
     def draw(self) -> None:
         """docstring"""
         with self.view.plot:
@@ -18,8 +145,25 @@ class MultiSeriesPlotPresenter(PlotPresenter):
                 if dataset:
                     self.plot_series(eid, dataset)
 
+    def refresh(self, _=None, skip_x=False) -> None:
+        """Update the existing lines in place, or redraw if none."""
+
+        if not skip_x:
+            self.window = None
+
+        if not self.lines:
+            super().refresh(skip_x=skip_x)
+            return
+
+        with self.view.plot:
+            for eid in self.lines:
+                self.update_series(eid, self.model.data[eid])
+
+        self._update_plot_axes(axis="y" if skip_x else "both")
+        self._show_legend()
+
     def download_data(self, _=None) -> None:
-        """docstring"""
+        """Export the full resolution series of each axis."""
 
         directory, prefix = self.get_destination_components()
 
@@ -29,20 +173,66 @@ class MultiSeriesPlotPresenter(PlotPresenter):
             axes.append(self.model.ax2)
 
         for i, ax in enumerate(axes, 1):
+            export_series(
+                f"{directory}/{prefix}_ax_{i}",
+                self.get_export_series(ax),
+                self.view.export_format.value,
+            )
 
-            suffix = f"ax_{i}.csv"
-            path = f"{directory}/{prefix}_{suffix}"
+    def get_export_series(self, ax: Axes) -> Iterator[Series]:
+        """Return the full resolution series of the axis lines.
 
-            plot = {line.get_label(): line.get_data() for line in ax.lines}
+        Lines sharing a label, e.g. of experiments of the same
+        sub-batch, are named after their experiment id as well, such
+        that each series is exported under a unique name.
+        """
 
-            df = pd.DataFrame()
+        eids = {
+            line: eid
+            for eid, lines in self.lines.items() for line in lines
+        }
+        counts = Counter(line.get_label() for line in ax.lines)
 
-            for series, (x, y) in plot.items():
-                new = pd.DataFrame({f"{series}_x": x, f"{series}_y": y})
-                df = pd.concat([df, new], axis=1)
+        for line in ax.lines:
+            name = line.get_label()
+            if counts[name] > 1 and line in eids:
+                name = f"{name}_{eids[line]}"
+            yield (name, *self.series.get(line, line.get_data()))
 
-            with open(path, "w+") as file:
-                df.to_csv(file, index=False)
+    ###################
+    # PRIVATE METHODS #
+    ###################
+
+    def _set_event_handlers(self) -> None:
+        """docstring"""
+
+        super()._set_event_handlers()
+
+        if self.MAX_POINTS:
+            self.view.resolution.observe(
+                names="value",
+                handler=self._redecimate,
+            )
+
+    def _update_xlim(self, _=None) -> None:
+        """docstring"""
+        super()._update_xlim()
+        self.window = self.view.xlim.value
+        self._redecimate()
+
+    def _redecimate(self, _=None) -> None:
+        """Decimate lines to the current resolution and x-limits."""
+        if self.series:
+            points = self.view.resolution.value
+            with self.view.plot:
+                for line, (x, y) in self.series.items():
+                    line.set_data(*decimate(x, y, points, self.window))
+
+    def _reset_plot(self) -> None:
+        """docstring"""
+        self.series.clear()
+        self.lines.clear()
+        super()._reset_plot()
 
 
 class StatisticalPlotPresenter(PlotPresenter):
@@ -56,53 +246,24 @@ class StatisticalPlotPresenter(PlotPresenter):
             if self.model.data:
                 self.plot_series(0, self.model.data)
 
+    def get_plotted_data(self) -> pd.DataFrame:
+        """Return the long-form data of the plot."""
+        return self.extract_data(self.model.data)
+
     def download_data(self, _=None) -> None:
-        """docstring"""
+        """Export the plotted data, one series per hue."""
 
         directory, prefix = self.get_destination_components()
-        path = f"{directory}/{prefix}.csv"
-
-        ax = self.model.ax
-
-        handles, labels = ax.get_legend_handles_labels()
-        colors = [patch.get_facecolor() for patch in handles]
-
-        legend_color_label_map: dict[str, str] = {
-            str(color[0]): label
-            for color, label in zip(colors, labels)
-        }
-
-        tick_mapping: dict[int, int] = {
-            text.get_position()[0]: int(text.get_text())
-            for text in ax.get_xticklabels()
-        }
-
-        data_per_series: dict[str, list[list[int | float]]] = {
-            label: [[], []]  # [[x-coords], [y-coords]]
-            for label in labels
-        }
-
-        collection: PathCollection
-        for collection in ax.collections:
-
-            if not isinstance(collection, PathCollection):
-                continue
-
-            colors = collection.get_facecolors()
-            offsets = collection.get_offsets()
-            x_coords = offsets[:, 0]
-            y_coords = offsets[:, 1]
 
-            for c, x, y in zip(colors, x_coords, y_coords):
-                label = legend_color_label_map[str(c)]
-                mapped_x = tick_mapping[int(round(x))]
-                data_per_series[label][0].append(mapped_x)
-                data_per_series[label][1].append(y)
+        data = self.get_plotted_data()
 
-        df = pd.DataFrame()
-        for series, (x, y) in data_per_series.items():
-            new = pd.DataFrame({f"{series}_x": x, f"{series}_y": y})
-            df = pd.concat([df, new], axis=1).convert_dtypes()
+        series = [] if data.empty else (
+            (str(label), group[self.X_LABEL].values,
+             group[self.Y_LABEL].values)
+            for label, group in data.groupby("hue", sort=False))
 
-        with open(path, "w+") as file:
-            df.to_csv(file, index=False)
+        export_series(
+            f"{directory}/{prefix}",
+            series,
+            self.view.export_format.value,
+        )
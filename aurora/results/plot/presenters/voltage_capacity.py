@@ -1,5 +1,4 @@
 import ipywidgets as ipw
-import numpy as np
 
 from ..model import PlotModel
 from ..view import PlotView
@@ -19,6 +18,10 @@ class VoltageCapacityPlotPresenter(MultiSeriesPlotPresenter):
 
     NORM_AX = "x"
 
+    MAX_POINTS = 5000
+
+    SERIES_CONTROLS = ("electrode", )
+
     def __init__(
         self,
         model: PlotModel,
@@ -51,13 +54,11 @@ class VoltageCapacityPlotPresenter(MultiSeriesPlotPresenter):
         y = dataset["Ewe"]
         return (x, y)
 
-    def plot_series(self, eid: int, dataset: dict) -> None:
+    def derive_series(self, eid: int, dataset: dict) -> tuple:
         """docstring"""
-        x, y = (np.array(a) for a in self.extract_data(dataset))
-        x /= self.model.get_weight(eid, self.view.electrode.value)
-        label, color = self.get_series_properties(eid)
-        line, = self.model.ax.plot(x, y, label=label, color=color)
-        self.store_color(line)
+        x, y = super().derive_series(eid, dataset)
+        x = x / self.model.get_weight(eid, self.view.electrode.value)
+        return (x, y)
 
     ###################
     # PRIVATE METHODS #
@@ -1,5 +1,3 @@
-import numpy as np
-
 from .parents import MultiSeriesPlotPresenter
 
 
@@ -18,6 +16,8 @@ class VoltageCurrentTimePlotPresenter(MultiSeriesPlotPresenter):
 
     bbox_to_anchor = (1.4, 1)
 
+    MAX_POINTS = 5000
+
     def extract_data(self, dataset: dict) -> tuple:
         """docstring"""
         x = dataset["time"] / 3600.
@@ -27,8 +27,33 @@ class VoltageCurrentTimePlotPresenter(MultiSeriesPlotPresenter):
 
     def plot_series(self, eid: int, dataset: dict) -> None:
         """docstring"""
-        x, yv, yi = (np.array(a) for a in self.extract_data(dataset))
+        x, yv, yi = self.get_series(eid, dataset)
+        label, color = self.get_series_properties(eid)
+        line_v = self.plot_line(
+            self.model.ax,
+            x,
+            yv,
+            label=f"{label}:V",
+            color=color,
+        )
+        line_i = self.plot_line(
+            self.model.ax2,
+            x,
+            yi,
+            "--",
+            label=f"{label}:I",
+            color=color,
+        )
+        self.lines[eid] = [line_v, line_i]
+        self.store_color(line_v)
+
+    def update_series(self, eid: int, dataset: dict) -> None:
+        """docstring"""
+        x, yv, yi = self.get_series(eid, dataset)
         label, color = self.get_series_properties(eid)
-        line, = self.model.ax.plot(x, yv, label=f"{label}:V", color=color)
-        self.model.ax2.plot(x, yi, "--", label=f"{label}:I", color=color)
-        self.store_color(line)
+        line_v, line_i = self.lines[eid]
+        self.set_line_data(line_v, x, yv)
+        self.set_line_data(line_i, x, yi)
+        line_v.set(label=f"{label}:V", color=color)
+        line_i.set(label=f"{label}:I", color=color)
+        self.store_color(line_v)
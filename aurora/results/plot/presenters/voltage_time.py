@@ -12,6 +12,8 @@ class VoltageTimePlotPresenter(MultiSeriesPlotPresenter):
 
     Y_LABEL = "Ewe [V]"
 
+    MAX_POINTS = 5000
+
     def extract_data(self, dataset: dict) -> tuple:
         """docstring"""
         x = dataset["time"] / 3600.
@@ -5,6 +5,8 @@ from pathlib import Path
 import ipywidgets as ipw
 from ipyfilechooser import FileChooser
 
+from ..export import EXPORT_FORMATS
+
 
 class PlotView(ipw.Accordion):
     """
@@ -80,6 +82,13 @@ class PlotView(ipw.Accordion):
     def _build_buttons(self) -> ipw.HBox:
         """docstring"""
 
+        self.export_format = ipw.Dropdown(
+            layout={
+                "width": "100px",
+            },
+            options=EXPORT_FORMATS,
+        )
+
         self.download_button = ipw.Button(
             layout={
                 "width": "fit-content",
@@ -112,6 +121,7 @@ class PlotView(ipw.Accordion):
                 "padding": "5px",
             },
             children=[
+                self.export_format,
                 self.download_button,
                 self.reset_button,
                 self.delete_button,
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import contextlib
+from datetime import datetime
+from pathlib import Path
+
+from aurora.time import TZ
 
 from .model import ResultsModel
 from .plot.factory import PlotPresenterFactory
@@ -9,6 +13,8 @@ from .plot.presenter import PlotPresenter
 from .plot.view import PlotView
 from .view import ResultsView
 
+EXPORTS_DIR = Path.home() / "apps/aurora/data/exports"
+
 
 class ResultsPresenter():
     """
@@ -28,6 +34,7 @@ class ResultsPresenter():
         self._set_event_handlers()
 
         self.update_view_experiments()
+        self.update_memory_usage()
 
     def update_view_experiments(self, _=None) -> None:
         """docstring"""
@@ -43,12 +50,25 @@ class ResultsPresenter():
         options = self._build_experiment_selector_options()
         self.view.experiment_selector.options = options
 
+    def update_memory_usage(self, _=None) -> None:
+        """docstring"""
+        size = self.model.results_size / 2**20
+        budget = self.model.results.max_size / 2**20
+        count = len(self.model.results)
+        usage = f"Results in memory: {size:.1f} / {budget:.0f} MB"
+        self.view.memory_usage.value = f"{usage} ({count} experiments)*"
+
     def toggle_plot_button(self, _=None) -> None:
         """docstring"""
         no_experiments = not self.view.experiment_selector.value
         no_plot_type = not self.view.plot_type_selector.value
         self.view.plot_button.disabled = no_experiments or no_plot_type
 
+    def toggle_export_button(self, _=None) -> None:
+        """docstring"""
+        no_experiments = not self.view.experiment_selector.value
+        self.view.export_button.disabled = no_experiments
+
     def update_group_name_state(self, _=None) -> None:
         """docstring"""
         no_experiments = not self.view.experiment_selector.value
@@ -79,6 +99,37 @@ class ResultsPresenter():
         self.update_view_experiments()
         self.view.group_name.value = ""
 
+    def on_export_button_click(self, _=None) -> None:
+        """Export the selected experiments to a zip archive."""
+
+        self.view.info.clear_output()
+
+        experiment_ids = list(self.view.experiment_selector.value)
+        fmt = self.view.export_format.value
+
+        EXPORTS_DIR.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now(TZ).strftime(r"%y%m%d-%H%M%S")
+        path = EXPORTS_DIR / f"{timestamp}_experiments.zip"
+
+        progress = self.view.export_progress
+        progress.max = len(experiment_ids)
+        progress.value = 0
+        progress.layout.display = "flex"
+        self.view.export_button.disabled = True
+
+        try:
+            for _ in self.model.export_experiments(experiment_ids, path, fmt):
+                progress.value += 1
+            message = f"Exported {progress.value} experiments to {path}"
+        except Exception as err:
+            path.unlink(missing_ok=True)
+            message = f"Export failed: {err}"
+        finally:
+            progress.layout.display = "none"
+            self.toggle_export_button()
+
+        self.display_info_message(message)
+
     def add_plot_view(self) -> None:
         """docstring"""
 
@@ -142,8 +193,14 @@ class ResultsPresenter():
     def toggle_widgets(self, _=None) -> None:
         """docstring"""
         self.toggle_plot_button()
+        self.toggle_export_button()
         self.update_group_name_state()
 
+    def prefetch_selection(self, _=None) -> None:
+        """Analyze the selected experiments ahead of plotting."""
+        if self.view.prefetch_check.value:
+            self.model.prefetch(list(self.view.experiment_selector.value))
+
     def schedule_monitor_kill_order(self, _=None) -> None:
         """docstring"""
         for eid in self.view.experiment_selector.value:
@@ -167,10 +224,14 @@ class ResultsPresenter():
         self.view.group_selector.observe(self.update_view_experiments, "value")
         self.view.last_days.observe(self.update_view_experiments, "value")
         self.view.experiment_selector.observe(self.toggle_widgets, "value")
+        self.view.experiment_selector.observe(self.prefetch_selection, "value")
+        self.view.prefetch_check.observe(self.prefetch_selection, "value")
         self.view.plot_type_selector.observe(self.toggle_plot_button, "value")
         self.view.weights_reset_button.on_click(self.reset_weights_file)
         self.view.group_name.observe(self.toggle_group_name_button, "value")
         self.view.group_add_button.on_click(self.on_group_add_button_click)
+        self.view.export_button.on_click(self.on_export_button_click)
+        self.model.observe(self.update_memory_usage, "results_size")
         self.view.weights_filechooser.register_callback(
             self.on_weights_file_change)
 
@@ -182,19 +243,21 @@ class ResultsPresenter():
 
     def _build_experiment_selector_options(self) -> list[tuple]:
         """Returns a (option_string, battery_id) list."""
-        return [(self._cast_row_as_option(row), row["id"])
-                for _, row in self.model.experiments.iterrows()]
-
-    def _cast_row_as_option(self, row: dict) -> str:
-        """docstring"""
-        pk = row["id"]
-        flag = self.model.get_experiment_extras(pk, "flag") or "❓"
-        label = row["label"] or "Experiment"
-        timestamp = row["ctime"]
-        option = f" {flag} {pk} : {label} : {timestamp}"
-        return option + f" : {status}" \
-            if (status := self.model.get_experiment_extras(pk, "status")) \
-            else option
+
+        df = self.model.experiments
+
+        if df.empty:
+            return []
+
+        flag = df["extras.flag"].astype(str).replace("", "❓")
+        label = df["label"].fillna("").replace("", "Experiment")
+        status = df["extras.status"].astype(str)
+
+        options = " " + flag + " " + df.index.astype(str) + " : " + label
+        options += " : " + df["ctime"]
+        options = options.where(status == "", options + " : " + status)
+
+        return list(zip(options, df.index.tolist()))
 
     def _has_valid_selection(self) -> bool:
         """docstring"""
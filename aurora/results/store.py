@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator, MutableMapping
+from typing import Any
+
+import numpy as np
+
+# per-point series of the analysis, packed by `compact`
+POINT_FIELDS = {
+    "time": np.float64,
+    "Ewe": np.float32,
+    "I": np.float32,
+    "Q": np.float32,
+}
+
+
+class MemoryStore(MutableMapping, ABC):
+    """
+    An in-memory store with a memory budget.
+
+    The size of each entry is tracked in bytes, and least recently
+    used entries are evicted once the total exceeds `max_size` bytes.
+    The latest entry is always kept, regardless of its size.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """docstring"""
+        self.max_size = max_size
+        self.size = 0
+        self.__entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.__sizes: dict[Hashable, int] = {}
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """Return the entry, marking it as recently used."""
+        entry = self.__entries[key]
+        self.__entries.move_to_end(key)
+        return entry
+
+    def __setitem__(self, key: Hashable, entry: Any) -> None:
+        """Store the entry, evicting others if over budget."""
+
+        if key in self.__entries:
+            del self[key]
+
+        self.__entries[key] = entry
+        self.__sizes[key] = self.get_size(entry)
+        self.size += self.__sizes[key]
+
+        self.evict()
+
+    def __delitem__(self, key: Hashable) -> None:
+        """docstring"""
+        del self.__entries[key]
+        self.size -= self.__sizes.pop(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Check membership without marking the entry as used."""
+        return key in self.__entries
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """docstring"""
+        return iter(self.__entries)
+
+    def __len__(self) -> int:
+        """docstring"""
+        return len(self.__entries)
+
+    def evict(self) -> None:
+        """Remove least recently used entries until within budget."""
+        while self.size > self.max_size and len(self.__entries) > 1:
+            del self[next(iter(self.__entries))]
+
+    @abstractmethod
+    def get_size(self, entry: Any) -> int:
+        """Return the size of the entry in bytes."""
+
+
+class ResultsStore(MemoryStore):
+    """
+    An in-memory store of analysis results with a memory budget.
+
+    Entries written through to a `ResultsCache` are reloaded from disk
+    when next requested, such that eviction spills rather than drops.
+    """
+
+    def __init__(self, max_size: int = 2**29) -> None:
+        """docstring"""
+        super().__init__(max_size)
+
+    def get_size(self, entry: dict) -> int:
+        """docstring"""
+        return get_entry_size(entry)
+
+
+class SeriesStore(MemoryStore):
+    """
+    An in-memory store of derived plot series with a memory budget.
+
+    Only arrays owning their data are counted, views of the analysis
+    results being accounted for by the `ResultsStore`.
+    """
+
+    def get_size(self, entry: tuple[np.ndarray, ...]) -> int:
+        """docstring"""
+        return sum(array.nbytes for array in entry if array.flags.owndata)
+
+
+def get_entry_size(entry: dict) -> int:
+    """Return the approximate resident size of the results entry in bytes.
+
+    Arrays are counted by the in-memory buffer holding them, once per
+    buffer, such that the views of a compacted array are accounted for
+    in full. Memory-mapped arrays are paged in on access and reclaimable
+    by the operating system, so they are not counted against the budget.
+    """
+    buffers = {
+        id(buffer): buffer.nbytes
+        for buffer in map(get_resident_buffer, entry["data"].values())
+        if buffer is not None
+    }
+    return sum(buffers.values()) + len(entry["log"])
+
+
+def get_resident_buffer(array: object) -> np.ndarray | None:
+    """Return the in-memory array owning the data of `array`, if any."""
+
+    if not isinstance(array, np.ndarray):
+        return None
+
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+
+    return None if isinstance(array, np.memmap) else array
+
+
+def compact(data: dict) -> dict:
+    """Return the data with its per-point series in a single array.
+
+    The series are packed as fields of one contiguous structured array
+    and exposed as views of it, such that consumers read them without
+    copying. Time is kept in double precision, as single precision
+    cannot resolve seconds over long experiments, while the other
+    series are stored in single precision.
+
+    Parameters
+    ----------
+    `data` : `dict`
+        The post-processed data.
+
+    Returns
+    -------
+    `dict`
+        The compacted data, or `data` as is if not a full analysis.
+    """
+
+    if not all(key in data for key in POINT_FIELDS):
+        return data
+
+    points = np.empty(len(data["time"]), dtype=list(POINT_FIELDS.items()))
+
+    for key in POINT_FIELDS:
+        points[key] = data[key]
+
+    return {**data, **{key: points[key] for key in POINT_FIELDS}}
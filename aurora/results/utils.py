@@ -3,25 +3,27 @@ from aiida_aurora.calculations.cycler import BatteryCyclerExperiment
 from aiida_aurora.data.battery import BatterySampleData
 
 
-def get_experiment_sample_id(eid: int) -> int:
+def get_sample_id(sample_node: BatterySampleData) -> int:
     """docstring"""
     try:
-        sample_name = get_experiment_sample_name(eid)
+        sample_name = sample_node["metadata"]["name"]
         return int(sample_name.split("-")[1])
     except Exception:
         return -1
 
 
-def get_experiment_sample_name(eid: int) -> str:
-    """docstring"""
-    sample_node = get_experiment_sample_node(eid)
-    return sample_node["metadata"]["name"]
-
-
-def get_experiment_sample_node(eid: int) -> BatterySampleData:
-    """docstring"""
+def get_experiment_samples(eids: list[int]) -> dict[int, BatterySampleData]:
+    """Return the sample nodes of the experiments in a single query."""
     qb = QueryBuilder()
-    qb.append(BatteryCyclerExperiment, filters={"id": eid}, tag="exp")
-    qb.append(BatterySampleData, with_outgoing="exp")
-    sample_node, = qb.first()
-    return sample_node
+    qb.append(
+        BatteryCyclerExperiment,
+        filters={
+            "id": {
+                "in": list(eids),
+            },
+        },
+        project="id",
+        tag="exp",
+    )
+    qb.append(BatterySampleData, with_outgoing="exp", project="*")
+    return dict(qb.all())
@@ -5,6 +5,8 @@ import os
 import ipywidgets as ipw
 from ipyfilechooser import FileChooser
 
+from .export import EXPORT_FORMATS
+
 BUTTON_LAYOUT = {
     "width": "fit-content",
 }
@@ -32,6 +34,11 @@ class ResultsView(ipw.VBox):
         ("Capacity swarm", "capacity_swarm"),
     ]
 
+    MEMORY_USAGE_INFO = (
+        "*Analysis results held in memory, against the results budget. "
+        "Series memory-mapped from the results cache and series derived "
+        "by open plots are not included.")
+
     def __init__(self) -> None:
         """docstring"""
 
@@ -79,6 +86,13 @@ class ResultsView(ipw.VBox):
             description="Last days:",
         )
 
+        self.memory_usage = ipw.Label(
+            layout={
+                "margin": "0 0 0 auto",
+            },
+            tooltip=self.MEMORY_USAGE_INFO,
+        )
+
         self.experiment_selector = ipw.SelectMultiple(
             layout={
                 "width": "auto",
@@ -132,6 +146,29 @@ class ResultsView(ipw.VBox):
             icon="thumbs-up",
         )
 
+        self.export_format = ipw.Dropdown(
+            layout={
+                "width": "100px",
+            },
+            options=EXPORT_FORMATS,
+        )
+
+        self.export_button = ipw.Button(
+            layout=BUTTON_LAYOUT,
+            button_style="info",
+            tooltip="Export selected experiments",
+            icon="file-archive-o",
+            disabled=True,
+        )
+
+        self.export_progress = ipw.IntProgress(
+            layout={
+                "width": "auto",
+                "display": "none",
+            },
+            description="Exporting:",
+        )
+
         self.active_check = ipw.Checkbox(
             layout=BUTTON_LAYOUT,
             style=ACTIVE_CHECK_STYLE,
@@ -139,6 +176,13 @@ class ResultsView(ipw.VBox):
             value=False,
         )
 
+        self.prefetch_check = ipw.Checkbox(
+            layout=BUTTON_LAYOUT,
+            style=ACTIVE_CHECK_STYLE,
+            description="prefetch selected",
+            value=False,
+        )
+
         self.group_name = ipw.Text(
             layout={},
             placeholder="Enter group name",
@@ -171,7 +215,10 @@ class ResultsView(ipw.VBox):
                                 self.update_button,
                                 self.thumb_down,
                                 self.thumb_up,
+                                self.export_format,
+                                self.export_button,
                                 self.active_check,
+                                self.prefetch_check,
                             ],
                         ),
                         ipw.HBox(
@@ -183,6 +230,7 @@ class ResultsView(ipw.VBox):
                         ),
                     ],
                 ),
+                self.export_progress,
                 self.info,
             ],
         )
@@ -199,6 +247,7 @@ class ResultsView(ipw.VBox):
                     children=[
                         self.group_selector,
                         self.last_days,
+                        self.memory_usage,
                     ],
                 ),
                 ipw.HBox(
@@ -0,0 +1,284 @@
+"""Fixtures of the offline benchmark suite.
+
+Run with `pytest tests/benchmarks`. Experiments are synthetic and
+analyzed with `post_process_data`, such that no AiiDA profile or
+daemon is required. Dataset sizes are set from the command line.
+
+Runs save nothing by default. Pass `--benchmark-autosave` to save
+results under `.benchmarks` (see `pytest.ini`), to be compared across
+commits with `pytest-benchmark compare` or `--benchmark-compare`.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+
+import matplotlib
+import numpy as np
+import pytest
+from aiida_aurora.utils.parsers import post_process_data
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    matplotlib.use("Agg")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("aurora benchmarks")
+    group.addoption(
+        "--cycling-points",
+        type=int,
+        default=100_000,
+        help="points per synthetic experiment of time series plots",
+    )
+    group.addoption(
+        "--cycling-experiments",
+        type=int,
+        default=10,
+        help="synthetic experiments per plot",
+    )
+    group.addoption(
+        "--cycling-cycles",
+        type=int,
+        default=50,
+        help="cycles per synthetic experiment",
+    )
+    group.addoption(
+        "--inventory-sizes",
+        default="1000,10000,100000",
+        help="comma-separated sample counts of synthetic inventories",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "inventory_size" in metafunc.fixturenames:
+        option = metafunc.config.getoption("--inventory-sizes")
+        sizes = [int(size) for size in option.split(",")]
+        metafunc.parametrize("inventory_size", sizes, scope="session")
+
+
+class Sample(dict):
+    """A stand-in for `BatterySampleData`, exposing its attributes."""
+
+    @property
+    def attributes(self) -> dict:
+        return self
+
+
+def make_sample(eid: int) -> Sample:
+    """Return a sample of the experiment, split across two sub-batches."""
+    return Sample(
+        metadata={
+            "name": f"sample-{eid}",
+            "batch": "batch",
+            "subbatch": str(eid % 2),
+        },
+        specs={
+            "composition": {
+                "anode": {
+                    "weight": {
+                        "net": 0.01
+                    }
+                },
+                "cathode": {
+                    "weight": {
+                        "net": 0.02
+                    }
+                },
+            },
+        },
+    )
+
+
+@lru_cache(maxsize=None)
+def make_dataset(points: int, cycles: int, seed: int = 0) -> dict:
+    """Return a synthetic galvanostatic cycling analysis.
+
+    Each cycle is a charge followed by a discharge at constant current,
+    with the voltage following the state of charge. The result has the
+    shape returned by `cycling_analysis`.
+    """
+
+    rng = np.random.default_rng(seed)
+
+    time = np.cumsum(rng.uniform(0.5, 1.5, points))
+    half_cycle = np.arange(points) * 2 * cycles // points
+    charging = half_cycle % 2 == 0
+
+    current = np.where(charging, 1e-3, -1.1e-3) * (1 + 0.1 * rng.random())
+    progress = np.linspace(0, 2 * cycles, points) % 1
+    soc = np.where(charging, progress, 1 - progress)
+    voltage = 3.0 + 1.2 * soc + rng.normal(0, 1e-3, points)
+
+    return post_process_data(time, voltage, current)
+
+
+def make_inventory(size: int, seed: int = 0) -> list[dict]:
+    """Return synthetic `BatterySample` payloads.
+
+    Specs are drawn from small pools of values, as in real inventories
+    of cells assembled in batches from a few materials.
+    """
+
+    rng = np.random.default_rng(seed)
+
+    def pick(values: list, count: int = size) -> np.ndarray:
+        return np.asarray(values, dtype=object)[rng.integers(len(values),
+                                                             size=count)]
+
+    batches = np.arange(size) // 50
+    manufacturers = pick(["BIG-MAP", "Empa", "KIT", "Uppsala", "CNRS"])
+    cases = pick(["CR2032", "CR2016", "Swagelok"])
+    separators = pick(["Whatman GF/D", "Celgard 2400", "Celgard 2325"])
+    anodes = pick(["Graphite", "Li", "Si/C", "LTO"])
+    cathodes = pick(["NMC811", "NMC622", "LFP", "LCO", "NCA"])
+    electrolytes = pick(["LP30", "LP40", "LP57", "1M LiPF6 EC:DMC"])
+    capacities = pick([1.5, 2.0, 3.0, 4.5])
+    groups = pick([set(), {"cycling"}, {"rate"}, {"cycling", "aging"}])
+    weights = rng.uniform(10, 30, (size, 2)).round(3)
+    days = rng.integers(0, 1000, size)
+
+    names = [
+        f"{m}_{b:05d}_{i % 50:02d}"
+        for i, (m, b) in enumerate(zip(manufacturers, batches))
+    ]
+    dates = [
+        datetime(2022, 1, 1) + timedelta(days=int(d), seconds=i)
+        for i, d in enumerate(days)
+    ]
+
+    def electrode(formula: str, weight: float) -> dict:
+        return {
+            "formula": formula,
+            "position": 1,
+            "diameter": {
+                "nominal": 15.0
+            },
+            "weight": {
+                "total": weight + 5,
+                "collector": 5.0,
+                "net": weight,
+            },
+            "capacity": {
+                "nominal": 3.0
+            },
+        }
+
+    return [{
+        "id": i + 1,
+        "specs": {
+            "case": cases[i],
+            "manufacturer": manufacturers[i],
+            "composition": {
+                "anode": electrode(anodes[i], weights[i, 0]),
+                "cathode": electrode(cathodes[i], weights[i, 1]),
+                "electrolyte": {
+                    "formula": electrolytes[i],
+                    "position": 3,
+                    "amount": 80.0,
+                },
+                "separator": {
+                    "name": separators[i],
+                    "diameter": {
+                        "nominal": 16.0
+                    },
+                },
+                "spacer": {
+                    "value": 0.5
+                },
+            },
+            "capacity": {
+                "nominal": capacities[i]
+            },
+        },
+        "metadata": {
+            "name": names[i],
+            "groups": {"all-samples", *groups[i]},
+            "batch": f"{batches[i]:05d}",
+            "subbatch": str(i % 50 // 10),
+            "creation_datetime": dates[i],
+            "creation_process": "synthetic",
+        },
+    } for i in range(size)]
+
+
+@pytest.fixture(scope="session")
+def inventory(inventory_size: int) -> list[dict]:
+    return make_inventory(inventory_size)
+
+
+@pytest.fixture(scope="session")
+def cycling_points(request: pytest.FixtureRequest) -> int:
+    return request.config.getoption("--cycling-points")
+
+
+@pytest.fixture(scope="session")
+def cycling_experiments(request: pytest.FixtureRequest) -> int:
+    return request.config.getoption("--cycling-experiments")
+
+
+@pytest.fixture(scope="session")
+def cycling_cycles(request: pytest.FixtureRequest) -> int:
+    return request.config.getoption("--cycling-cycles")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def home(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Isolate the plot and export directories of the app."""
+    home = tmp_path_factory.mktemp("home")
+    (home / "apps/aurora/data/plots").mkdir(parents=True)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("HOME", str(home))
+        yield home
+
+
+@pytest.fixture
+def build_presenter(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Return a factory of started plot presenters of synthetic data."""
+
+    from aurora.results.model import ResultsModel
+    from aurora.results.plot.factory import PlotPresenterFactory
+    from aurora.results.plot.model import PlotModel
+    from aurora.results.plot.view import PlotView
+
+    monkeypatch.setattr(
+        "aurora.results.plot.model.get_experiment_samples",
+        lambda eids: {eid: make_sample(eid)
+                      for eid in eids},
+    )
+
+    def build(plot_type: str, experiments: int, points: int, cycles: int):
+
+        results_model = ResultsModel(memory_size=2**40)
+
+        for eid in range(1, experiments + 1):
+            results_model.results[eid] = {
+                "data": make_dataset(points, cycles, eid),
+                "log": "",
+                "mtime": None,
+                "final": True,
+            }
+
+        plot_model = PlotModel(results_model, list(results_model.results))
+        plot_view = PlotView()
+
+        presenter = PlotPresenterFactory.build(
+            plot_type,
+            plot_type,
+            plot_model,
+            plot_view,
+        )
+
+        monkeypatch.setattr(
+            presenter,
+            "get_destination_components",
+            lambda: (str(tmp_path), plot_type),
+        )
+
+        presenter.start()
+
+        return presenter
+
+    return build
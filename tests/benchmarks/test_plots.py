@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pytest
+
+from aurora.results.export import EXPORT_FORMATS
+
+pytest.importorskip("pytest_benchmark")
+
+MULTI_SERIES_PLOT_TYPES = (
+    "current_time",
+    "voltage_time",
+    "voltagecurrent_time",
+    "voltage_capacity",
+    "capacity_cycle",
+    "efficiency_cycle",
+)
+
+SWARM_CELLS = (10, 100, 500)
+
+# points per cycle of swarm cells, of which only cycle summaries are plotted
+SWARM_CYCLE_POINTS = 200
+
+
+@pytest.fixture(params=MULTI_SERIES_PLOT_TYPES)
+def presenter(
+    request,
+    build_presenter,
+    cycling_experiments,
+    cycling_points,
+    cycling_cycles,
+):
+    return build_presenter(
+        request.param,
+        cycling_experiments,
+        cycling_points,
+        cycling_cycles,
+    )
+
+
+@pytest.fixture(params=SWARM_CELLS, ids=lambda cells: f"{cells}-cells")
+def swarm_presenter(request, build_presenter, cycling_cycles):
+    return build_presenter(
+        "capacity_swarm",
+        request.param,
+        cycling_cycles * SWARM_CYCLE_POINTS,
+        cycling_cycles,
+    )
+
+
+def redraw(presenter) -> None:
+    """Reset the plot and drop derived series, as on a new plot."""
+    presenter._reset_plot()
+    presenter.model.derived.clear()
+
+
+@pytest.mark.benchmark(group="draw")
+def test_draw(benchmark, presenter):
+    """Time `extract_data` followed by `plot_series` of all experiments."""
+    benchmark.pedantic(
+        presenter.draw,
+        setup=lambda: redraw(presenter),
+        rounds=5,
+    )
+
+
+@pytest.mark.benchmark(group="refresh")
+def test_refresh(benchmark, presenter):
+    """Time refreshing the plot with the derived series in memory."""
+    benchmark(presenter.refresh)
+
+
+@pytest.mark.benchmark(group="refresh")
+def test_refresh_derive(benchmark, presenter):
+    """Time refreshing the plot as on a change of controls."""
+    benchmark.pedantic(
+        presenter.refresh,
+        setup=presenter.model.derived.clear,
+        rounds=5,
+    )
+
+
+@pytest.mark.benchmark(group="download")
+@pytest.mark.parametrize("fmt", [fmt for _, fmt in EXPORT_FORMATS])
+def test_download_data(benchmark, presenter, fmt):
+    presenter.view.export_format.value = fmt
+    benchmark.pedantic(presenter.download_data, rounds=3)
+
+
+@pytest.mark.benchmark(group="swarm")
+def test_swarm_draw(benchmark, swarm_presenter):
+    benchmark.pedantic(
+        swarm_presenter.draw,
+        setup=swarm_presenter._reset_plot,
+        rounds=3,
+    )
+
+
+@pytest.mark.benchmark(group="swarm")
+def test_swarm_download_data(benchmark, swarm_presenter):
+    benchmark.pedantic(swarm_presenter.download_data, rounds=3)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import pytest
+from aiida_aurora.schemas.battery import BatterySample
+
+from aurora.common.models import SamplesModel
+from aurora.common.models.backends import JSONBackend
+from aurora.common.widgets.filters import Filters
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="session")
+def backend(tmp_path_factory, inventory) -> JSONBackend:
+    """Return a JSON backend persisting the inventory."""
+    backend = JSONBackend(tmp_path_factory.mktemp("samples"), "samples.json")
+    backend.save(inventory)
+    return backend
+
+
+@pytest.fixture(scope="session")
+def model(backend) -> SamplesModel:
+    model = SamplesModel(backend)
+    model.load()
+    return model
+
+
+@pytest.fixture
+def filters(model) -> Filters:
+    return Filters(model)
+
+
+def get_query() -> dict:
+    """Return a typical filter state of the sample selector."""
+    return {
+        "group": "cycling",
+        "from": "2022-06-01",
+        "to": None,
+        "specs.manufacturer": ["BIG-MAP", "Empa"],
+        "specs.composition.cathode.formula": ["NMC811", "LFP"],
+    }
+
+
+@pytest.mark.benchmark(group="samples-load")
+def test_load(benchmark, backend):
+    """Time fetching, validating and caching the inventory."""
+    model = SamplesModel(backend)
+    benchmark.pedantic(model.load, rounds=3)
+
+
+@pytest.mark.benchmark(group="samples-cache")
+def test_cache(benchmark, model):
+    benchmark.pedantic(model.cache, rounds=3)
+
+
+@pytest.mark.benchmark(group="samples-save")
+def test_save(benchmark, model):
+    benchmark.pedantic(model.save, rounds=3)
+
+
+@pytest.mark.benchmark(group="samples-update")
+def test_update(benchmark, model):
+    """Time editing a single sample."""
+    sample = BatterySample(**model.raw[-1])
+    benchmark.pedantic(model.update, (sample, ), {"save": False}, rounds=3)
+
+
+@pytest.mark.benchmark(group="samples-update")
+def test_add_delete_many(benchmark, model):
+    """Time adding and deleting a batch of samples."""
+
+    first = model.highest_sample_id + 1
+    samples = [
+        BatterySample(**{
+            **model.raw[0], "id": id
+        }) for id in range(first, first + 50)
+    ]
+    ids = [sample.id for sample in samples]
+
+    def add_delete_many() -> None:
+        model.add_many(samples, save=False)
+        model.delete_many(ids, save=False)
+
+    benchmark.pedantic(add_delete_many, rounds=3)
+
+
+@pytest.mark.benchmark(group="samples-query")
+def test_query(benchmark, model):
+    benchmark(lambda: model.query(get_query()))
+
+
+@pytest.mark.benchmark(group="samples-query")
+def test_query_all(benchmark, model):
+    benchmark(lambda: model.query({}))
+
+
+@pytest.mark.benchmark(group="samples-query")
+def test_get_group_samples(benchmark, model):
+    benchmark(model.get_group_samples, "cycling")
+
+
+@pytest.mark.benchmark(group="samples-query")
+def test_get_group_labels(benchmark, model):
+    benchmark(model.get_group_labels)
+
+
+@pytest.mark.benchmark(group="samples-filters")
+def test_filter_options(benchmark, filters):
+    """Time rebuilding the filter options following a selection."""
+    filters.grid_filters[2].value = ["BIG-MAP"]
+    benchmark.pedantic(filters.update_grid, rounds=3)
@@ -0,0 +1,160 @@
+"""Fixtures of the unit test suite.
+
+Run with `pytest tests/unit`. No AiiDA profile is required, nodes
+being replaced by stand-ins where needed.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from aiida_aurora.utils.analyzers import CapacityAnalyzer
+from aiida_aurora.utils.parsers import post_process_data
+
+EPOCH = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def make_cycling(points: int, cycles: int, seed: int = 0) -> tuple:
+    """Return the `(time, Ewe, I)` of a synthetic galvanostatic run."""
+
+    rng = np.random.default_rng(seed)
+
+    time = np.cumsum(rng.uniform(0.5, 1.5, points))
+    charging = np.arange(points) * 2 * cycles // points % 2 == 0
+    current = np.where(charging, 1e-3, -1.1e-3)
+    progress = np.linspace(0, 2 * cycles, points) % 1
+    soc = np.where(charging, progress, 1 - progress)
+    voltage = 3.0 + 1.2 * soc + rng.normal(0, 1e-3, points)
+
+    return time, voltage, current
+
+
+def make_snapshot(run: tuple, points: int, keep_last: int = 10) -> dict:
+    """Return the monitor snapshot of the first points of the run.
+
+    As stored in extras by the monitor, the snapshot is post-processed,
+    truncated to its last cycles by the `CapacityAnalyzer`, and
+    serialized to lists.
+    """
+    analyzer = CapacityAnalyzer(keep_last=keep_last)
+    analyzer.snapshot = post_process_data(*(a[:points] for a in run))
+    analyzer._truncate_snapshot()
+    return {key: list(value) for key, value in analyzer.snapshot.items()}
+
+
+class Experiments():
+    """Stand-ins of running experiment nodes, monitored by snapshot."""
+
+    def __init__(self) -> None:
+        self.nodes: dict[int, SimpleNamespace] = {}
+        self.loads = 0
+
+    def update(self, eid: int, snapshot: dict, terminated=False) -> None:
+        """Record a new snapshot of the experiment."""
+        previous = self.nodes.get(eid)
+        mtime = previous.mtime + timedelta(minutes=1) if previous else EPOCH
+        self.nodes[eid] = SimpleNamespace(
+            pk=eid,
+            mtime=mtime,
+            is_terminated=terminated,
+            snapshot=snapshot,
+        )
+
+    def load_experiment(self, node: SimpleNamespace) -> tuple[str, dict]:
+        self.loads += 1
+        return f"CalcJob: <{node.pk}>\n", {
+            "warning": "",
+            "snapshot": node.snapshot,
+        }
+
+
+@pytest.fixture
+def experiments(monkeypatch: pytest.MonkeyPatch) -> Experiments:
+    """Patch the results model to analyze experiment stand-ins."""
+
+    experiments = Experiments()
+
+    monkeypatch.setattr(
+        "aurora.results.model.load_node",
+        lambda pk: experiments.nodes[pk],
+    )
+    monkeypatch.setattr(
+        "aurora.results.model.get_results_mtime",
+        lambda node: node.mtime,
+    )
+    monkeypatch.setattr(
+        "aurora.results.model.load_experiment",
+        experiments.load_experiment,
+    )
+
+    return experiments
+
+
+def make_sample(sid: int, cathode: str = "NMC811", groups=()) -> dict:
+    """Return a `BatterySample` payload."""
+
+    def electrode(formula: str) -> dict:
+        return {
+            "formula": formula,
+            "position": 1,
+            "diameter": {
+                "nominal": 15.0
+            },
+            "weight": {
+                "total": 25.0,
+                "collector": 5.0,
+                "net": 20.0,
+            },
+            "capacity": {
+                "nominal": 3.0
+            },
+        }
+
+    return {
+        "id": sid,
+        "specs": {
+            "case": "CR2032",
+            "manufacturer": "Empa",
+            "composition": {
+                "anode": electrode("Graphite"),
+                "cathode": electrode(cathode),
+                "electrolyte": {
+                    "formula": "LP30",
+                    "position": 3,
+                    "amount": 80.0,
+                },
+                "separator": {
+                    "name": "Whatman GF/D",
+                    "diameter": {
+                        "nominal": 16.0
+                    },
+                },
+                "spacer": {
+                    "value": 0.5
+                },
+            },
+            "capacity": {
+                "nominal": 3.0
+            },
+        },
+        "metadata": {
+            "name": f"sample-{sid}",
+            "groups": {"all-samples", *groups},
+            "batch": "00001",
+            "subbatch": "0",
+            "creation_datetime": EPOCH + timedelta(days=sid),
+            "creation_process": "synthetic",
+        },
+    }
+
+
+@pytest.fixture
+def samples() -> list[dict]:
+    """Return payloads of samples of two cathodes, partly grouped."""
+    cathodes = ("NMC811", "LFP")
+    return [
+        make_sample(sid, cathodes[sid % 2], ("cycling", ) if sid % 3 else ())
+        for sid in range(1, 11)
+    ]
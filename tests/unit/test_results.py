@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import numpy as np
+from aiida_aurora.utils.cycling_analysis import get_data_from_snapshot
+from conftest import Experiments, make_cycling, make_snapshot
+
+from aurora.results.model import ResultsModel
+from aurora.results.plot.model import PlotModel
+
+
+def assert_data_equal(data: dict, expected: dict) -> None:
+    assert data.keys() == expected.keys()
+    for key in expected:
+        np.testing.assert_array_equal(data[key], expected[key], err_msg=key)
+
+
+def test_refresh_matches_truncated_snapshot(experiments: Experiments) -> None:
+    """Refreshed results do not depend on the number of refreshes."""
+
+    model = ResultsModel()
+    run = make_cycling(60_000, 30)
+
+    for points in (20_000, 21_500, 23_000, 60_000):
+        snapshot = make_snapshot(run, points)
+        experiments.update(1, snapshot)
+
+        list(model.run_cycling_analyses([1]))
+
+        expected = get_data_from_snapshot(snapshot)
+        assert_data_equal(model.results[1]["data"], expected)
+
+    data = model.results[1]["data"]
+    assert list(data["cycle-number"]) == list(range(20, 30))
+    assert len(data["time"]) < len(run[0])
+
+
+def test_plot_refreshes_running_experiments(experiments: Experiments) -> None:
+    """Plots refresh running experiments and reuse final results."""
+
+    model = ResultsModel()
+    run = make_cycling(60_000, 30)
+
+    experiments.update(1, make_snapshot(run, 20_000))
+    plot = PlotModel(model, [1])
+    list(plot.fetch_data())
+
+    snapshot = make_snapshot(run, 21_500)
+    experiments.update(1, snapshot, terminated=True)
+    list(plot.fetch_data())
+
+    assert_data_equal(plot.data[1], get_data_from_snapshot(snapshot))
+    assert model.has_final_results(1)
+
+    loads = experiments.loads
+    list(PlotModel(model, [1]).fetch_data())
+    assert experiments.loads == loads
+
+
+def test_failed_analysis_is_reported_and_retried(
+        experiments: Experiments) -> None:
+    """A failure is isolated to its experiment and retried on request."""
+
+    model = ResultsModel()
+    run = make_cycling(60_000, 30)
+
+    experiments.update(2, make_snapshot(run, 20_000))
+
+    # experiment 1 is not loadable yet
+    assert list(model.run_cycling_analyses([1, 2])) == [1, 2]
+    assert "ERROR" in model.results[1]["log"]
+    assert not model.results[1]["data"]
+    assert model.results[2]["data"]
+
+    snapshot = make_snapshot(run, 20_000)
+    experiments.update(1, snapshot)
+
+    plot = PlotModel(model, [1])
+    list(plot.fetch_data())
+
+    assert_data_equal(plot.data[1], get_data_from_snapshot(snapshot))
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import pytest
+from aiida_aurora.schemas.battery import BatterySample
+from conftest import make_sample
+
+from aurora.common.models import SamplesModel
+from aurora.common.models import samples as samples_module
+from aurora.common.models.samples import get_group_index
+
+
+def build(samples: list[dict]) -> SamplesModel:
+    """Return a model of the samples, fully cached."""
+    model = SamplesModel()
+    model.raw = samples
+    model.cache()
+    return model
+
+
+def get_groups(model: SamplesModel) -> dict[str, set[int]]:
+    return {
+        label: model.get_group_samples(label)
+        for label in model.get_group_labels()
+    }
+
+
+def assert_matches_rebuild(model: SamplesModel) -> None:
+    """Assert the cache and group index match a full rebuild."""
+    rebuilt = build(model.raw)
+    assert model == rebuilt
+    assert model.view.index.tolist() == rebuilt.view.index.tolist()
+    assert get_groups(model) == get_groups(rebuilt)
+
+
+def test_upserts_match_rebuild(samples: list[dict]) -> None:
+    model = build(samples[:6])
+
+    model.add_many([BatterySample(**sample) for sample in samples[6:]])
+    assert_matches_rebuild(model)
+
+    model.update(BatterySample(**make_sample(2, "LCO", ("rate", ))))
+    assert_matches_rebuild(model)
+
+    model.delete_many([3, 7])
+    assert_matches_rebuild(model)
+
+    assert model.get_group_samples("rate") == {2}
+    assert model.get_group_samples("cycling") == {1, 4, 5, 8, 10}
+    assert model.query({"specs.composition.cathode.formula": "LCO"}) \
+        .index.tolist() == [2]
+
+
+def test_upsert_into_empty_model(samples: list[dict]) -> None:
+    model = SamplesModel()
+
+    model.add(BatterySample(**samples[0]))
+    assert_matches_rebuild(model)
+
+    model.delete(samples[0]["id"])
+    assert model.view.empty
+    assert model.get_group_labels() == []
+
+
+def test_group_index_follows_group_edits(samples: list[dict]) -> None:
+    model = build(samples)
+
+    model.add_to_group([1, 3], "rate")
+    model.remove_from_group([2, 4], "cycling")
+    model.save_group([6], "aging")
+    model.save_group([], "rate")
+
+    expected = {
+        label: ids
+        for label, ids in get_group_index(model.view).items() if ids
+    }
+    assert get_groups(model) == expected
+    assert "rate" not in model.get_group_labels()
+    assert model.query({"group": "aging"}).index.tolist() == [6]
+    assert model.query({"group": "cycling"}).index.tolist() == [1, 5, 7, 8, 10]
+
+
+@pytest.fixture
+def evaluated(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the fields of evaluated query conditions."""
+
+    fields: list[str] = []
+    get_mask = samples_module.get_mask
+
+    def record(df, field, value):
+        fields.append(field)
+        return get_mask(df, field, value)
+
+    monkeypatch.setattr(samples_module, "get_mask", record)
+
+    return fields
+
+
+def test_masks_cached_until_update(
+    samples: list[dict],
+    evaluated: list[str],
+) -> None:
+    model = build(samples)
+    query = {"specs.composition.cathode.formula": ["LCO", "LFP"]}
+
+    assert model.query(query).index.tolist() == [1, 3, 5, 7, 9]
+    assert model.query(query).index.tolist() == [1, 3, 5, 7, 9]
+    assert len(evaluated) == 1
+
+    model.update(BatterySample(**make_sample(2, "LCO")))
+
+    assert model.query(query).index.tolist() == [1, 2, 3, 5, 7, 9]
+    assert len(evaluated) == 2
+
+    model.assign_subbatch([1, 2], "1")
+    subbatch = {"metadata.subbatch": "1"}
+
+    assert model.query(subbatch).index.tolist() == [1, 2]
+    model.assign_subbatch([3], "1")
+    assert model.query(subbatch).index.tolist() == [1, 2, 3]
+
+
+def test_group_masks_follow_group_edits(samples: list[dict]) -> None:
+    model = build(samples)
+
+    assert model.query({"group": "rate"}).empty
+
+    model.add_to_group([4], "rate")
+    assert model.query({"group": "rate"}).index.tolist() == [4]
+
+    model.remove_from_group([4], "rate")
+    assert model.query({"group": "rate"}).empty
+
+
+def test_id_conditions_not_cached(
+    samples: list[dict],
+    evaluated: list[str],
+) -> None:
+    model = build(samples)
+
+    for sid in (1, 2, 1):
+        assert model.get_sample(sid).index.tolist() == [sid]
+
+    assert evaluated == ["id"] * 3